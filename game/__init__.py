@@ -1 +1 @@
-# 테트리스 게임 패키지
+# 테트리스 게임 패키지
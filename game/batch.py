@@ -0,0 +1,172 @@
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, List, Optional
+from .game import Game
+from .headless import HeadlessRunner
+
+# 게임마다 수집하는 결과 항목
+RESULT_FIELDS = ('score', 'level', 'lines_cleared', 'pieces_placed')
+
+
+def play_game(seed: int, max_ticks: int = 100000, controller: Optional[Callable] = None) -> dict:
+    """
+    시드를 고정한 게임 하나를 화면 없이 끝까지 진행
+
+    Args:
+        seed: 게임 시드
+        max_ticks: 진행할 최대 틱 수
+        controller: 매 틱 호출되는 입력 함수 (프로세스 풀에서 쓰려면 모듈 최상위 함수여야 함)
+
+    Returns:
+        dict: 시드, 점수, 레벨, 삭제한 줄 수, 놓은 블록 수, 진행한 틱 수
+    """
+    game = Game(seed=seed)
+    stats = HeadlessRunner(game, inputs=controller).run(max_ticks)
+    return {
+        'seed': seed,
+        'score': game.score,
+        'level': game.level,
+        'lines_cleared': game.lines_cleared,
+        'pieces_placed': game.pieces_placed,
+        'ticks': stats['ticks'],
+    }
+
+
+def _play_chunk(seeds: List[int], max_ticks: int, controller: Optional[Callable]) -> List[dict]:
+    """작업 프로세스에서 시드 묶음을 차례로 진행"""
+    return [play_game(seed, max_ticks, controller) for seed in seeds]
+
+
+class BatchSummary:
+    """게임 결과를 하나씩 받아 요약 통계를 누적하는 클래스 (결과 자체는 보관하지 않음)"""
+
+    def __init__(self, fields=RESULT_FIELDS):
+        """
+        요약 통계 초기화
+
+        Args:
+            fields: 통계를 낼 결과 항목 이름들
+        """
+        self.fields = tuple(fields)
+        self.count = 0
+        self._mean = {field: 0.0 for field in self.fields}
+        self._m2 = {field: 0.0 for field in self.fields}
+        self._min = {field: None for field in self.fields}
+        self._max = {field: None for field in self.fields}
+
+    def add(self, result: dict):
+        """
+        게임 결과 하나를 통계에 반영 (Welford 방식의 평균/분산 누적)
+
+        Args:
+            result: play_game이 반환한 결과
+        """
+        self.count += 1
+        for field in self.fields:
+            value = result[field]
+            delta = value - self._mean[field]
+            self._mean[field] += delta / self.count
+            self._m2[field] += delta * (value - self._mean[field])
+            if self._min[field] is None or value < self._min[field]:
+                self._min[field] = value
+            if self._max[field] is None or value > self._max[field]:
+                self._max[field] = value
+
+    def to_dict(self) -> dict:
+        """
+        항목별 평균, 표준편차, 최솟값, 최댓값을 딕셔너리로 반환
+
+        Returns:
+            dict: {'games': 게임 수, 항목 이름: {'mean', 'stdev', 'min', 'max'}}
+        """
+        summary = {'games': self.count}
+        for field in self.fields:
+            variance = self._m2[field] / (self.count - 1) if self.count > 1 else 0.0
+            summary[field] = {
+                'mean': self._mean[field],
+                'stdev': math.sqrt(variance),
+                'min': self._min[field],
+                'max': self._max[field],
+            }
+        return summary
+
+
+def iter_batch(n_games: int, base_seed: int = 0, workers: Optional[int] = None,
+               max_ticks: int = 100000, controller: Optional[Callable] = None,
+               chunk_size: int = 1) -> Iterator[dict]:
+    """
+    게임 n_games개를 프로세스 풀에서 진행하고 끝나는 순서대로 결과를 하나씩 돌려줌
+
+    한 번에 작업자 수의 두 배만큼만 작업을 제출하므로 게임 수가 많아도
+    대기 중인 작업과 결과가 메모리에 쌓이지 않는다.
+
+    Args:
+        n_games: 진행할 게임 수
+        base_seed: 첫 게임의 시드 (i번째 게임은 base_seed + i)
+        workers: 작업 프로세스 수 (None이면 CPU 코어 수)
+        max_ticks: 게임마다 진행할 최대 틱 수
+        controller: 매 틱 호출되는 입력 함수 (모듈 최상위 함수)
+        chunk_size: 작업 하나에 묶어서 보낼 게임 수 (짧은 게임이 많을 때 통신 비용 감소)
+
+    Yields:
+        dict: 게임 하나의 결과 (play_game 참고)
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = iter(range(base_seed, base_seed + n_games))
+
+    def next_chunk() -> List[int]:
+        chunk = []
+        for seed in seeds:
+            chunk.append(seed)
+            if len(chunk) >= chunk_size:
+                break
+        return chunk
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        while True:
+            # 작업자마다 두 개씩만 앞서 제출
+            while len(pending) < workers * 2:
+                chunk = next_chunk()
+                if not chunk:
+                    break
+                pending.add(executor.submit(_play_chunk, chunk, max_ticks, controller))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    yield result
+
+
+def run_batch(n_games: int, base_seed: int = 0, workers: Optional[int] = None,
+              max_ticks: int = 100000, controller: Optional[Callable] = None,
+              chunk_size: int = 1, on_result: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    게임 n_games개를 병렬로 진행하고 요약 통계를 반환
+
+    Args:
+        n_games: 진행할 게임 수
+        base_seed: 첫 게임의 시드
+        workers: 작업 프로세스 수 (None이면 CPU 코어 수)
+        max_ticks: 게임마다 진행할 최대 틱 수
+        controller: 매 틱 호출되는 입력 함수 (모듈 최상위 함수)
+        chunk_size: 작업 하나에 묶어서 보낼 게임 수
+        on_result: 게임 결과가 도착할 때마다 호출할 함수 (예: 파일에 한 줄씩 기록)
+
+    Returns:
+        dict: BatchSummary.to_dict() 결과
+    """
+    summary = BatchSummary()
+    for result in iter_batch(n_games, base_seed, workers, max_ticks, controller, chunk_size):
+        summary.add(result)
+        if on_result is not None:
+            on_result(result)
+    return summary.to_dict()
+
+
+# 데모용: 게임 100개를 병렬로 진행하고 요약 통계를 출력 (python -m game.batch)
+if __name__ == "__main__":
+    print(run_batch(100))
@@ -0,0 +1,254 @@
+from typing import List
+from game.block import Block, BlockType, SHAPE_BOUNDS, SHAPE_OFFSETS, SHAPE_ROW_MASKS
+
+# 색상 평면에 저장하는 칸 코드 (0 = 빈 칸, 1~7 = BlockType, 8 = 타입 정보 없는 칸)
+EMPTY_CODE = 0
+FILLED_CODE = len(BlockType) + 1
+BLOCK_TYPE_CODES = {block_type: index + 1 for index, block_type in enumerate(BlockType)}
+CODE_BLOCK_TYPES = [None] + list(BlockType) + [True]
+
+
+class _RowView:
+    """BitBoard의 한 줄을 리스트처럼 읽고 쓰기 위한 뷰"""
+
+    __slots__ = ('_board', '_y')
+
+    def __init__(self, board: 'BitBoard', y: int):
+        self._board = board
+        self._y = y
+
+    def __getitem__(self, x: int):
+        if x < 0:
+            x += self._board.width
+        if not 0 <= x < self._board.width:
+            raise IndexError(x)
+        return self._board.get_cell(x, self._y)
+
+    def __setitem__(self, x: int, value):
+        if x < 0:
+            x += self._board.width
+        if not 0 <= x < self._board.width:
+            raise IndexError(x)
+        self._board.set_cell(x, self._y, value)
+
+    def __len__(self) -> int:
+        return self._board.width
+
+    def __iter__(self):
+        board = self._board
+        start = self._y * board.width
+        for code in board.colors[start:start + board.width]:
+            yield CODE_BLOCK_TYPES[code]
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _GridView:
+    """BitBoard를 기존 Board.grid와 같은 2차원 리스트처럼 보여주는 뷰"""
+
+    __slots__ = ('_board',)
+
+    def __init__(self, board: 'BitBoard'):
+        self._board = board
+
+    def __getitem__(self, y: int) -> _RowView:
+        if y < 0:
+            y += self._board.height
+        if not 0 <= y < self._board.height:
+            raise IndexError(y)
+        return _RowView(self._board, y)
+
+    def __len__(self) -> int:
+        return self._board.height
+
+    def __iter__(self):
+        for y in range(self._board.height):
+            yield _RowView(self._board, y)
+
+
+class BitBoard:
+    """
+    줄마다 정수 비트마스크를 사용하는 테트리스 게임 보드 클래스
+
+    Board와 같은 API를 제공하므로 Game과 GameRenderer에서 그대로 사용할 수 있다.
+    각 줄은 x번째 비트가 (x, y) 칸의 점유 여부를 나타내는 정수이고,
+    블록 타입은 칸마다 1바이트인 색상 평면(colors)에 따로 저장한다.
+    """
+
+    def __init__(self, width: int = 12, height: int = 20):
+        """보드 초기화"""
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.rows = [0] * height
+        self.colors = bytearray(width * height)
+
+    @property
+    def grid(self) -> _GridView:
+        """기존 Board.grid와 호환되는 2차원 뷰 (grid[y][x])"""
+        return _GridView(self)
+
+    def get_cell(self, x: int, y: int):
+        """(x, y) 칸의 블록 타입을 반환 (비어있으면 None)"""
+        return CODE_BLOCK_TYPES[self.colors[y * self.width + x]]
+
+    def set_cell(self, x: int, y: int, value):
+        """
+        (x, y) 칸의 값을 설정
+
+        Args:
+            x: x 좌표
+            y: y 좌표
+            value: BlockType, None(빈 칸) 또는 그 밖의 값(타입 정보 없이 채워진 칸)
+        """
+        if value is None:
+            self.rows[y] &= ~(1 << x)
+            self.colors[y * self.width + x] = EMPTY_CODE
+        else:
+            self.rows[y] |= 1 << x
+            self.colors[y * self.width + x] = BLOCK_TYPE_CODES.get(value, FILLED_CODE)
+
+    def is_valid_position(self, x: int, y: int) -> bool:
+        """
+        주어진 위치가 보드 내부에 있는지 확인
+
+        Args:
+            x: x 좌표
+            y: y 좌표
+
+        Returns:
+            bool: 유효한 위치면 True, 그렇지 않으면 False
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def place_block(self, block: Block):
+        """블록을 보드에 배치"""
+        code = BLOCK_TYPE_CODES[block.block_type]
+        block_x = block.x
+        block_y = block.y
+        for rel_x, rel_y in SHAPE_OFFSETS[block.block_type][block.rotation]:
+            x = block_x + rel_x
+            y = block_y + rel_y
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self.rows[y] |= 1 << x
+                self.colors[y * self.width + x] = code
+
+    def check_collision(self, block: Block) -> bool:
+        """
+        블록이 다른 블록이나 경계와 충돌하는지 확인
+
+        Args:
+            block: 확인할 블록
+
+        Returns:
+            bool: 충돌하면 True, 그렇지 않으면 False
+        """
+        x = block.x
+        y = block.y
+        min_x, min_y, max_x, max_y = SHAPE_BOUNDS[block.block_type][block.rotation]
+
+        # 경계 확인
+        if x + min_x < 0 or x + max_x >= self.width or y + min_y < 0 or y + max_y >= self.height:
+            return True
+
+        # 다른 블록과의 충돌 확인 (줄마다 AND 연산 한 번)
+        rows = self.rows
+        for rel_y, mask in SHAPE_ROW_MASKS[block.block_type][block.rotation]:
+            if rows[y + rel_y] & (mask << x):
+                return True
+
+        return False
+
+    def remove_block(self, block: Block):
+        """
+        블록을 보드에서 제거
+
+        Args:
+            block: 제거할 블록
+        """
+        block_x = block.x
+        block_y = block.y
+        for rel_x, rel_y in SHAPE_OFFSETS[block.block_type][block.rotation]:
+            x = block_x + rel_x
+            y = block_y + rel_y
+            if self.is_valid_position(x, y):
+                self.rows[y] &= ~(1 << x)
+                self.colors[y * self.width + x] = EMPTY_CODE
+
+    def get_full_lines(self) -> List[int]:
+        """
+        가득 찬 줄의 인덱스를 반환
+
+        Returns:
+            List[int]: 가득 찬 줄의 y 좌표 리스트
+        """
+        full_row = self.full_row
+        return [y for y, row in enumerate(self.rows) if row == full_row]
+
+    def clear_full_lines(self):
+        """가득 찬 줄들을 삭제하고 위의 블록들을 아래로 이동"""
+        full_lines = self.get_full_lines()
+
+        if full_lines:
+            # 남은 줄들을 한 번에 아래로 모으고 맨 위를 빈 줄로 채움
+            width = self.width
+            full_set = set(full_lines)
+            kept = [y for y in range(self.height) if y not in full_set]
+            self.rows = [0] * len(full_lines) + [self.rows[y] for y in kept]
+            colors = bytearray(width * len(full_lines))
+            for y in kept:
+                colors += self.colors[y * width:(y + 1) * width]
+            self.colors = colors
+
+        return len(full_lines)
+
+    def is_empty(self, x: int, y: int) -> bool:
+        """
+        주어진 위치가 비어있는지 확인
+
+        Args:
+            x: x 좌표
+            y: y 좌표
+
+        Returns:
+            bool: 비어있으면 True, 그렇지 않으면 False
+        """
+        if not self.is_valid_position(x, y):
+            return False
+        return not (self.rows[y] >> x) & 1
+
+    def visualize(self) -> str:
+        """
+        보드를 텍스트로 시각화
+
+        Returns:
+            str: 보드의 시각적 표현
+        """
+        result = "게임 보드:\n"
+        result += "  " + "".join([str(i % 10) for i in range(self.width)]) + "\n"
+
+        for y in range(self.height):
+            result += f"{y:2d}"
+            for x in range(self.width):
+                value = self.get_cell(x, y)
+                if value is None:
+                    result += "."
+                elif isinstance(value, BlockType):
+                    result += value.value
+                else:
+                    result += "#"
+            result += "\n"
+
+        return result
+
+    def __str__(self) -> str:
+        """보드의 문자열 표현"""
+        return f"BitBoard({self.width}x{self.height})"
+
+    def __repr__(self) -> str:
+        """보드의 디버그용 문자열 표현"""
+        return self.__str__()
@@ -0,0 +1,77 @@
+import time
+from typing import Optional
+
+
+class FixedTimestepClock:
+    """
+    고정 간격 게임 로직 스케줄러
+
+    실제로 흐른 시간을 누적기에 모아 두고, 고정된 간격(step_ms)만큼 쌓일 때마다
+    로직 한 틱을 실행하게 한다. 화면 주사율(30, 60, 144Hz)과 상관없이 로직은 같은
+    속도로 진행되고, 남은 누적 시간 비율(alpha)로 프레임 사이를 보간할 수 있다.
+    """
+
+    def __init__(self, tick_rate: float = 60, max_steps_per_frame: int = 5):
+        """
+        스케줄러 초기화
+
+        Args:
+            tick_rate: 초당 로직 틱 수
+            max_steps_per_frame: 한 프레임에서 따라잡을 최대 틱 수 (너무 느려지면 나머지는 버림)
+        """
+        self.tick_rate = tick_rate
+        self.step_ms = 1000.0 / tick_rate
+        self.max_steps_per_frame = max_steps_per_frame
+        self.accumulator = 0.0
+        self.last_time: Optional[float] = None
+        self.total_steps = 0
+
+    def advance(self, elapsed_ms: float) -> int:
+        """
+        흐른 시간을 누적하고 이번 프레임에 실행할 로직 틱 수를 반환
+
+        Args:
+            elapsed_ms: 직전 호출 이후 흐른 시간 (밀리초)
+
+        Returns:
+            int: 실행할 로직 틱 수 (최대 max_steps_per_frame)
+        """
+        self.accumulator += max(0.0, elapsed_ms)
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps_per_frame:
+            # 따라잡을 수 없을 만큼 밀렸으면 한 틱 미만만 남기고 버림
+            steps = self.max_steps_per_frame
+            self.accumulator %= self.step_ms
+        else:
+            self.accumulator -= steps * self.step_ms
+        self.total_steps += steps
+        return steps
+
+    def update(self, now_ms: Optional[float] = None) -> int:
+        """
+        현재 시각을 받아 이번 프레임에 실행할 로직 틱 수를 반환
+
+        Args:
+            now_ms: 현재 시각 (밀리초, None이면 time.perf_counter 사용)
+
+        Returns:
+            int: 실행할 로직 틱 수
+        """
+        if now_ms is None:
+            now_ms = time.perf_counter() * 1000.0
+        if self.last_time is None:
+            self.last_time = now_ms
+            return 0
+        elapsed = now_ms - self.last_time
+        self.last_time = now_ms
+        return self.advance(elapsed)
+
+    @property
+    def alpha(self) -> float:
+        """다음 틱까지 진행된 비율 (0.0 ~ 1.0, 프레임 보간용)"""
+        return self.accumulator / self.step_ms
+
+    def reset(self):
+        """누적 시간과 기준 시각을 초기화 (일시정지 해제 후 밀린 시간을 버릴 때 사용)"""
+        self.accumulator = 0.0
+        self.last_time = None
@@ -0,0 +1,136 @@
+import random
+from collections import deque
+from typing import List, Optional
+from .block import BlockType
+
+# 블록 타입을 한 번만 튜플로 만들어 두고 매번 list(BlockType)를 만들지 않음
+BLOCK_TYPES = tuple(BlockType)
+
+
+class PieceGenerator:
+    """
+    블록 타입 생성기 기본 클래스
+
+    생성기마다 자기 random.Random을 가지므로 같은 시드는 항상 같은 순서를 만들고,
+    여러 게임을 동시에 진행해도 서로의 순서에 영향을 주지 않는다.
+    """
+
+    def __init__(self, seed: Optional[int] = None, preview_size: int = 1,
+                 rng: Optional[random.Random] = None):
+        """
+        생성기 초기화
+
+        Args:
+            seed: 난수 시드 (None이면 무작위)
+            preview_size: 미리 뽑아 둘 블록 수 (미리보기 대기열 깊이)
+            rng: 직접 지정할 난수 생성기 (지정하면 seed는 무시)
+        """
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.preview_size = preview_size
+        self.queue = deque()
+        self._refill(preview_size)
+
+    def _draw(self) -> BlockType:
+        """난수로 블록 타입 하나를 뽑음 (하위 클래스에서 구현)"""
+        raise NotImplementedError
+
+    def _refill(self, count: int):
+        """대기열에 블록이 count개 이상 있도록 채움"""
+        queue = self.queue
+        draw = self._draw
+        while len(queue) < count:
+            queue.append(draw())
+
+    def next(self) -> BlockType:
+        """
+        다음 블록 타입을 꺼내고 대기열을 다시 채움
+
+        Returns:
+            BlockType: 다음 블록 타입
+        """
+        self._refill(self.preview_size + 1)
+        return self.queue.popleft()
+
+    def peek(self, count: Optional[int] = None) -> List[BlockType]:
+        """
+        꺼내지 않고 앞으로 나올 블록 타입들을 반환
+
+        Args:
+            count: 볼 블록 수 (None이면 preview_size만큼, 모자라면 더 뽑아 둠)
+
+        Returns:
+            List[BlockType]: 나올 순서대로의 블록 타입 리스트
+        """
+        if count is None:
+            count = self.preview_size
+        self._refill(count)
+        queue = self.queue
+        return [queue[i] for i in range(count)]
+
+    def generate_into(self, out: list, start: int = 0, count: Optional[int] = None) -> list:
+        """
+        미리 할당한 리스트에 블록 타입을 순서대로 채움 (대량 생성용)
+
+        Args:
+            out: 결과를 채울 리스트
+            start: 채우기 시작할 위치
+            count: 채울 개수 (None이면 리스트 끝까지)
+
+        Returns:
+            list: 채워진 out
+        """
+        if count is None:
+            count = len(out) - start
+        queue = self.queue
+        draw = self._draw
+        for i in range(start, start + count):
+            # 대기열에 남은 블록부터 순서를 지켜 사용
+            out[i] = queue.popleft() if queue else draw()
+        self._refill(self.preview_size)
+        return out
+
+    def generate(self, count: int) -> List[BlockType]:
+        """
+        블록 타입 count개를 한 번에 생성
+
+        Args:
+            count: 생성할 개수
+
+        Returns:
+            List[BlockType]: 생성된 블록 타입 리스트
+        """
+        return self.generate_into([None] * count)
+
+
+class UniformGenerator(PieceGenerator):
+    """7가지 블록을 매번 같은 확률로 뽑는 생성기"""
+
+    def _draw(self) -> BlockType:
+        return BLOCK_TYPES[self.rng.randrange(len(BLOCK_TYPES))]
+
+
+class BagGenerator(PieceGenerator):
+    """7가지 블록을 한 가방에 넣고 섞어서 차례로 꺼내는 7-bag 생성기"""
+
+    def __init__(self, seed: Optional[int] = None, preview_size: int = 1,
+                 rng: Optional[random.Random] = None):
+        # 가방 리스트는 한 번만 만들고 매번 제자리에서 섞음
+        self._bag = list(BLOCK_TYPES)
+        self._bag_index = len(self._bag)
+        super().__init__(seed, preview_size, rng)
+
+    def _draw(self) -> BlockType:
+        if self._bag_index >= len(self._bag):
+            self.rng.shuffle(self._bag)
+            self._bag_index = 0
+        block_type = self._bag[self._bag_index]
+        self._bag_index += 1
+        return block_type
+
+
+# 이름으로 생성기를 고를 때 쓰는 표
+GENERATORS = {
+    'uniform': UniformGenerator,
+    'bag': BagGenerator,
+}
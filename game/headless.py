@@ -0,0 +1,138 @@
+import time
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+from .game import Game
+
+# 입력 이름과 Game 조작 메서드 이름의 대응표
+ACTIONS = {
+    'left': 'move_block_left',
+    'right': 'move_block_right',
+    'down': 'move_block_down',
+    'rotate': 'rotate_block',
+    'drop': 'drop_block_to_bottom',
+}
+
+# 시뮬레이션 한 틱의 길이 (밀리초, 60Hz 기준)
+DEFAULT_TICK_MS = 1000 / 60
+
+# 입력 스트림: (틱, 입력 이름) 목록 또는 게임을 받아 입력을 돌려주는 함수
+InputSource = Union[Iterable[Tuple[int, str]], Callable[[Game], Union[None, str, List[str]]]]
+
+
+class HeadlessRunner:
+    """pygame 없이 가상 시계로 Game을 진행시키는 실행기"""
+
+    def __init__(self, game: Game, inputs: Optional[InputSource] = None,
+                 tick_ms: float = DEFAULT_TICK_MS):
+        """
+        실행기 초기화
+
+        Args:
+            game: 진행시킬 게임
+            inputs: (틱, 입력 이름) 목록 또는 매 틱 호출되는 입력 함수 (None이면 입력 없음)
+            tick_ms: 한 틱이 나타내는 가상 시간 (밀리초)
+        """
+        self.game = game
+        self.tick_ms = tick_ms
+        self.tick = 0
+        self.sim_time = 0.0  # 가상 시계 (밀리초)
+
+        self.controller = None
+        self.scripted_inputs = None
+        if callable(inputs):
+            self.controller = inputs
+        elif inputs is not None:
+            self.scripted_inputs = iter(inputs)
+        self._pending_input = None
+
+        if self.game.current_block is None:
+            self.game.spawn_new_block()
+
+    def apply_action(self, action: str):
+        """
+        입력 하나를 게임에 적용
+
+        Args:
+            action: 입력 이름 ('left', 'right', 'down', 'rotate', 'drop')
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"알 수 없는 입력입니다: {action}")
+        getattr(self.game, ACTIONS[action])()
+        self.game.check_spawn_collision()
+
+    def _next_actions(self) -> List[str]:
+        """현재 틱에 적용할 입력 목록을 반환"""
+        if self.controller is not None:
+            actions = self.controller(self.game)
+            if actions is None:
+                return []
+            if isinstance(actions, str):
+                return [actions]
+            return list(actions)
+
+        if self.scripted_inputs is None:
+            return []
+
+        # 정렬된 (틱, 입력) 목록에서 현재 틱까지의 입력을 꺼냄
+        actions = []
+        while True:
+            if self._pending_input is None:
+                self._pending_input = next(self.scripted_inputs, None)
+                if self._pending_input is None:
+                    self.scripted_inputs = None
+                    break
+            tick, action = self._pending_input
+            if tick > self.tick:
+                break
+            actions.append(action)
+            self._pending_input = None
+        return actions
+
+    def step(self):
+        """입력 처리와 블록 자동 낙하를 한 틱만큼 진행"""
+        game = self.game
+
+        for action in self._next_actions():
+            if game.game_over:
+                break
+            self.apply_action(action)
+
+        # 가상 시계를 고정 틱 하나만큼 진행 (자동 낙하는 Game.update가 처리)
+        self.sim_time += self.tick_ms
+        game.update(self.tick_ms)
+
+        self.tick += 1
+
+    def run(self, max_ticks: int = 100000) -> dict:
+        """
+        게임 오버 또는 최대 틱까지 가능한 한 빠르게 진행
+
+        Args:
+            max_ticks: 진행할 최대 틱 수
+
+        Returns:
+            dict: 진행한 틱 수, 실제 걸린 시간, 초당 틱 수와 최종 게임 상태
+        """
+        start = time.perf_counter()
+        start_tick = self.tick
+        while not self.game.game_over and self.tick - start_tick < max_ticks:
+            self.step()
+        elapsed = time.perf_counter() - start
+
+        ticks = self.tick - start_tick
+        return {
+            'ticks': ticks,
+            'elapsed': elapsed,
+            'ticks_per_second': ticks / elapsed if elapsed > 0 else float('inf'),
+            'sim_time_ms': self.sim_time,
+            'score': self.game.score,
+            'level': self.game.level,
+            'lines_cleared': self.game.lines_cleared,
+            'game_over': self.game.game_over,
+        }
+
+
+# 데모용: 화면 없이 게임 하나를 끝까지 진행하고 속도를 출력 (python -m game.headless)
+if __name__ == "__main__":
+    result = HeadlessRunner(Game()).run()
+    print(f"틱: {result['ticks']}, 점수: {result['score']}, "
+          f"초당 틱: {result['ticks_per_second']:.0f}")
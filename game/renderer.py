@@ -1,372 +1,685 @@
-import pygame
-from typing import Tuple, Optional
-from .game import Game
-from .block import Block, BlockType
-from .board import Board
-import random
-
-class GameRenderer:
-    """테트리스 게임 렌더링 클래스"""
-    
-    def __init__(self, width: int = 1536, height: int = 1152):  # 1024x768의 150%
-        """렌더러 초기화"""
-        pygame.init()
-        self.width = width
-        self.height = height
-        self.screen = pygame.display.set_mode((width, height))
-        pygame.display.set_caption("테트리스 게임")
-        
-        # 일시정지 상태 추가
-        self.paused = False
-        
-        # 다채로운 색상 정의
-        self.colors = {
-            'background': (15, 15, 35),  # 어두운 네이비 배경
-            'grid': (40, 40, 60),  # 어두운 회색 그리드
-            'block': (255, 255, 255),  # 흰색 블록 (기본)
-            'text': (255, 255, 255),  # 흰색 텍스트
-            'red': (255, 80, 80),  # 밝은 빨간색
-            'yellow': (255, 255, 100),  # 밝은 노란색
-            'green': (80, 255, 80),  # 밝은 초록색
-            'blue': (80, 80, 255),  # 밝은 파란색
-            'orange': (255, 180, 80),  # 밝은 주황색
-            'purple': (200, 80, 255),  # 밝은 보라색
-            'cyan': (80, 255, 255),  # 밝은 청록색
-            'pink': (255, 150, 200),  # 핑크색
-            'lime': (150, 255, 150),  # 라임색
-            'gold': (255, 215, 0),  # 금색
-            'silver': (192, 192, 192),  # 은색
-        }
-        
-        # 폰트 초기화 (D2Coding 폰트 사용)
-        try:
-            # D2Coding 폰트 사용 (한글 지원 우수)
-            self.font = pygame.font.SysFont('D2Coding', 28, bold=True)
-            self.small_font = pygame.font.SysFont('D2Coding', 20, bold=True)
-            print("D2Coding 폰트 사용 중")
-        except:
-            try:
-                # D2Coding이 없으면 D2Coding Ver1.3 시도
-                self.font = pygame.font.SysFont('D2Coding Ver1.3', 28, bold=True)
-                self.small_font = pygame.font.SysFont('D2Coding Ver1.3', 20, bold=True)
-                print("D2Coding Ver1.3 폰트 사용 중")
-            except:
-                try:
-                    # D2Coding이 없으면 맑은 고딕 시도
-                    self.font = pygame.font.SysFont('malgun gothic', 28, bold=True)
-                    self.small_font = pygame.font.SysFont('malgun gothic', 20, bold=True)
-                    print("맑은 고딕 폰트 사용 중")
-                except:
-                    # 모든 폰트가 실패하면 기본 폰트 사용
-                    self.font = pygame.font.Font(None, 28)
-                    self.small_font = pygame.font.Font(None, 20)
-                    print("기본 폰트 사용 중")
-        
-        # 게임 보드 크기 및 위치 (중앙 정렬)
-        self.board_width = 12  # 10 → 12 (15% 증가)
-        self.board_height = 20
-        self.cell_size = 35  # 기존 크기 유지
-        
-        # 중앙 정렬 계산
-        board_pixel_width = self.board_width * self.cell_size
-        board_pixel_height = self.board_height * self.cell_size
-        self.board_x = (self.width - board_pixel_width) // 2
-        self.board_y = (self.height - board_pixel_height) // 2 - 50  # 위로 50픽셀만 이동 (더 중앙에)
-        
-        # UI 영역 설정 (게임보드 오른쪽, 더 넓은 간격)
-        self.ui_x = self.board_x + board_pixel_width + 80  # 간격을 50에서 80으로 증가
-        self.ui_y = self.board_y
-        
-        # 컨트롤키 영역 설정 (게임보드 왼쪽, 더 넓은 간격)
-        self.controls_x = self.board_x - 300  # 간격을 250에서 300으로 증가
-        self.controls_y = self.board_y + 30   # 게임보드 상단에서 30픽셀 아래
-    
-    def render_game(self, game: Game):
-        """전체 게임 화면 렌더링"""
-        # 배경 그리기
-        self.screen.fill(self.colors['background'])
-        
-        # 게임 보드 그리기
-        self.render_board(game.board)
-        
-        # 현재 블록 그리기
-        if game.current_block:
-            self.render_block(game.current_block)
-        
-        # UI 요소 그리기
-        self.render_ui(game)
-        
-        # 일시정지 화면 그리기
-        if self.paused:
-            self.render_pause_screen()
-        
-        # 화면 업데이트
-        pygame.display.flip()
-    
-    def render_board(self, board: Board):
-        """게임 보드 렌더링"""
-        # 보드 배경 그리기
-        board_rect = pygame.Rect(
-            self.board_x, 
-            self.board_y, 
-            self.board_width * self.cell_size, 
-            self.board_height * self.cell_size
-        )
-        pygame.draw.rect(self.screen, self.colors['grid'], board_rect)
-        
-        # 보드 그리드 그리기
-        for x in range(self.board_width + 1):
-            start_pos = (self.board_x + x * self.cell_size, self.board_y)
-            end_pos = (self.board_x + x * self.cell_size, self.board_y + self.board_height * self.cell_size)
-            pygame.draw.line(self.screen, self.colors['grid'], start_pos, end_pos, 1)
-        
-        for y in range(self.board_height + 1):
-            start_pos = (self.board_x, self.board_y + y * self.cell_size)
-            end_pos = (self.board_x + self.board_width * self.cell_size, self.board_y + y * self.cell_size)
-            pygame.draw.line(self.screen, self.colors['grid'], start_pos, end_pos, 1)
-        
-        # 배치된 블록들 그리기 (색상 유지)
-        for y in range(self.board_height):
-            for x in range(self.board_width):
-                if board.grid[y][x] is not None:
-                    self.render_cell(x, y, board.grid[y][x])
-    
-    def get_block_color(self, block_type):
-        """블록 타입에 따른 색상 반환"""
-        color_map = {
-            BlockType.I: self.colors['cyan'],  # I 블록: 밝은 청록색
-            BlockType.O: self.colors['yellow'],  # O 블록: 밝은 노란색
-            BlockType.T: self.colors['purple'],  # T 블록: 밝은 보라색
-            BlockType.S: self.colors['green'],  # S 블록: 밝은 초록색
-            BlockType.Z: self.colors['red'],  # Z 블록: 밝은 빨간색
-            BlockType.J: self.colors['blue'],  # J 블록: 밝은 파란색
-            BlockType.L: self.colors['orange'],  # L 블록: 밝은 주황색
-        }
-        return color_map.get(block_type, self.colors['block'])
-    
-    def render_block(self, block: Block):
-        """현재 블록 렌더링"""
-        block_color = self.get_block_color(block.block_type)
-        
-        # 블록의 각 셀을 그리기
-        for x, y in block.get_cells():
-            screen_x = self.board_x + (block.x + x) * self.cell_size
-            screen_y = self.board_y + (block.y + y) * self.cell_size
-            
-            # 블록이 보드 범위 내에 있을 때만 그리기
-            if 0 <= block.x + x < self.board_width and 0 <= block.y + y < self.board_height:
-                cell_rect = pygame.Rect(screen_x, screen_y, self.cell_size, self.cell_size)
-                pygame.draw.rect(self.screen, block_color, cell_rect)
-                pygame.draw.rect(self.screen, self.colors['grid'], cell_rect, 1)
-    
-    def render_cell(self, x: int, y: int, cell_value):
-        """개별 셀 렌더링 (배치된 블록)"""
-        # 블록 타입에 따른 색상 적용
-        if isinstance(cell_value, BlockType):
-            block_color = self.get_block_color(cell_value)
-        else:
-            block_color = self.colors['block']  # 기본 흰색
-        
-        cell_rect = pygame.Rect(
-            self.board_x + x * self.cell_size, 
-            self.board_y + y * self.cell_size, 
-            self.cell_size, 
-            self.cell_size
-        )
-        pygame.draw.rect(self.screen, block_color, cell_rect)
-        pygame.draw.rect(self.screen, self.colors['grid'], cell_rect, 1)
-    
-    def render_ui(self, game: Game):
-        """UI 요소 렌더링"""
-        # 점수 표시 (금색, 더 큰 폰트)
-        score_text = self.font.render(f"점수: {game.score}", True, self.colors['gold'])
-        self.screen.blit(score_text, (self.ui_x, self.ui_y))
-        
-        # 레벨 표시 (파란색)
-        level_text = self.font.render(f"레벨: {game.level}", True, self.colors['blue'])
-        self.screen.blit(level_text, (self.ui_x, self.ui_y + 60))  # 간격 증가
-        
-        # 삭제된 줄 수 표시 (라임색)
-        lines_text = self.font.render(f"줄: {game.lines_cleared}", True, self.colors['lime'])
-        self.screen.blit(lines_text, (self.ui_x, self.ui_y + 120))  # 간격 증가
-        
-        # 다음 블록 미리보기
-        self.render_next_block_preview(game)
-        
-        # 컨트롤키 안내
-        self.render_controls()
-        
-        # 게임 오버 메시지
-        if game.game_over:
-            self.render_game_over_screen()
-    
-    def render_controls(self):
-        """컨트롤키 안내 렌더링 (작은 폰트)"""
-        # 컨트롤키 제목
-        controls_title = self.small_font.render("컨트롤:", True, self.colors['silver'])
-        self.screen.blit(controls_title, (self.controls_x, self.controls_y))
-        
-        # 컨트롤키 목록
-        controls = [
-            "← → : 블록 이동",
-            "↓ : 블록 빠른 낙하", 
-            "↑ : 블록 회전",
-            "스페이스 : 블록 즉시 낙하",
-            "P : 일시정지",
-            "R : 게임 재시작",
-            "ESC : 게임 종료"
-        ]
-        
-        for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, self.colors['text'])
-            self.screen.blit(control_text, (self.controls_x, self.controls_y + 35 + i * 28))  # 간격 최적화
-    
-    def render_next_block_preview(self, game: Game):
-        """다음 블록 미리보기 렌더링"""
-        # 다음 블록 미리보기 영역
-        preview_x = self.ui_x
-        preview_y = self.ui_y + 180  # 간격 증가
-        
-        # 미리보기 제목 (은색, 작은 폰트)
-        preview_title = self.small_font.render("다음 블록:", True, self.colors['silver'])
-        self.screen.blit(preview_title, (preview_x, preview_y))
-        
-        # 다음 블록 그리기
-        next_block = game.get_next_block_preview()
-        if next_block:
-            # 미리보기 블록을 중앙에 배치
-            preview_cell_size = 30  # 미리보기 블록 크기 조정
-            block_width = max([x for x, y in next_block.get_cells()]) + 1
-            block_height = max([y for x, y in next_block.get_cells()]) + 1
-            
-            center_x = preview_x + (4 * preview_cell_size - block_width * preview_cell_size) // 2
-            center_y = preview_y + 40  # 간격 조정
-            
-            self.render_preview_block(next_block, center_x, center_y, preview_cell_size)
-    
-    def render_preview_block(self, block: Block, x: int, y: int, cell_size: int = 20):
-        """미리보기 블록 렌더링"""
-        block_color = self.get_block_color(block.block_type)
-        
-        for block_x, block_y in block.get_cells():
-            screen_x = x + block_x * cell_size
-            screen_y = y + block_y * cell_size
-            
-            cell_rect = pygame.Rect(screen_x, screen_y, cell_size, cell_size)
-            pygame.draw.rect(self.screen, block_color, cell_rect)
-            pygame.draw.rect(self.screen, self.colors['grid'], cell_rect, 1)
-    
-    def render_game_over_screen(self):
-        """게임 오버 화면 렌더링"""
-        # 반투명 오버레이
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill(self.colors['background'])
-        self.screen.blit(overlay, (0, 0))
-        
-        # 게임 오버 메시지
-        game_over_text = self.font.render("게임 오버!", True, self.colors['red'])
-        text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
-        self.screen.blit(game_over_text, text_rect)
-        
-        # 재시작 안내
-        restart_text = self.font.render("R키를 눌러 재시작", True, self.colors['text'])
-        restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 20))
-        self.screen.blit(restart_text, restart_rect)
-    
-    def cleanup(self):
-        """리소스 정리"""
-        pygame.quit()
-    
-    def handle_key_press(self, key: int, game: Game):
-        """키 입력 처리"""
-        if game.game_over:
-            if key == pygame.K_r:
-                game.reset_game()
-            return
-        
-        # 게임 컨트롤
-        if key == pygame.K_LEFT:
-            game.move_block_left()
-        elif key == pygame.K_RIGHT:
-            game.move_block_right()
-        elif key == pygame.K_DOWN:
-            game.move_block_down()
-        elif key == pygame.K_UP:
-            game.rotate_block()
-        elif key == pygame.K_SPACE:
-            game.drop_block_to_bottom()
-        elif key == pygame.K_p:
-            self.paused = not self.paused  # 최소한의 구현
-        elif key == pygame.K_r:
-            game.reset_game()
-        elif key == pygame.K_ESCAPE:
-            # ESC 키로 게임 종료
-            return False  # False를 반환하여 게임 루프 종료
-    
-    def handle_events(self, game: Game):
-        """키보드 이벤트 처리"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            elif event.type == pygame.KEYDOWN:
-                result = self.handle_key_press(event.key, game)
-                if result is False:  # ESC 키나 다른 종료 조건
-                    return False
-        
-        return True
-    
-    def render_pause_screen(self):
-        """일시정지 화면 렌더링"""
-        # 반투명 오버레이
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill(self.colors['background'])
-        self.screen.blit(overlay, (0, 0))
-        
-        # 일시정지 메시지
-        pause_text = self.font.render("일시정지", True, self.colors['yellow'])
-        text_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
-        self.screen.blit(pause_text, text_rect)
-        
-        # 재개 안내
-        resume_text = self.small_font.render("P키를 눌러 재개", True, self.colors['green'])
-        resume_rect = resume_text.get_rect(center=(self.width // 2, self.height // 2 + 20))
-        self.screen.blit(resume_text, resume_rect)
-    
-    def run_game_loop(self, game: Game):
-        """메인 게임 루프 실행"""
-        clock = pygame.time.Clock()
-        running = True
-        last_drop_time = pygame.time.get_ticks()
-        
-        while running:
-            current_time = pygame.time.get_ticks()
-            
-            # 이벤트 처리
-            running = self.handle_events(game)
-            
-            # 게임 로직 업데이트 (일시정지가 아닐 때만)
-            if not game.game_over and not self.paused:
-                self.update_game_logic(game, current_time, last_drop_time)
-                last_drop_time = current_time
-            
-            # 화면 렌더링
-            self.render_game(game)
-            
-            # FPS 제한
-            clock.tick(60)
-        
-        self.cleanup()
-    
-    def update_game_logic(self, game: Game, current_time: int, last_drop_time: int):
-        """게임 로직 업데이트"""
-        # 블록 자동 낙하
-        drop_interval = int(1000 / game.get_drop_speed())  # 밀리초 단위
-        
-        if current_time - last_drop_time >= drop_interval:
-            if not game.move_block_down():
-                # 블록이 바닥에 닿았으면 새 블록 생성
-                game.spawn_new_block()
-                if game.current_block and game.board.check_collision(game.current_block):
-                    game.game_over = True
+import pygame
+from collections import OrderedDict
+from typing import Tuple, Optional
+from .game import Game
+from .block import Block, BlockType, SHAPE_BOUNDS, SHAPE_OFFSETS
+from .board import Board
+from .clock import FixedTimestepClock
+import random
+
+class GameRenderer:
+    """테트리스 게임 렌더링 클래스"""
+    
+    def __init__(self, width: int = 1536, height: int = 1152, incremental: bool = False,
+                 text_cache_size: int = 64, fps: int = 60, logic_rate: int = 60,
+                 max_catchup_steps: int = 5, interpolate: bool = False,
+                 idle_timeout_ms: int = 1000):  # 1024x768의 150%
+        """
+        렌더러 초기화
+        
+        Args:
+            width: 화면 너비
+            height: 화면 높이
+            incremental: True면 바뀐 영역만 다시 그리는 부분 렌더링 모드 사용
+            text_cache_size: 글자 이미지 캐시에 보관할 최대 개수
+            fps: 초당 최대 렌더링 횟수 (화면 주사율)
+            logic_rate: 초당 게임 로직 틱 수 (렌더링과 무관하게 고정)
+            max_catchup_steps: 한 프레임에서 따라잡을 최대 로직 틱 수
+            interpolate: True면 떨어지는 블록을 다음 낙하까지의 진행 비율만큼 부드럽게 그림 (전체 렌더링 모드)
+            idle_timeout_ms: 일시정지/게임 오버 중 입력을 기다리다 한 번씩 깨어나는 간격 (밀리초)
+        """
+        pygame.init()
+        self.width = width
+        self.height = height
+        self.screen = pygame.display.set_mode((width, height))
+        pygame.display.set_caption("테트리스 게임")
+        
+        # 일시정지 상태 추가
+        self.paused = False
+        
+        # 렌더링 속도와 고정 간격 로직 설정
+        self.fps = fps
+        self.logic_rate = logic_rate
+        self.max_catchup_steps = max_catchup_steps
+        self.interpolate = interpolate
+        self.idle_timeout_ms = idle_timeout_ms
+        
+        # 부분 렌더링 모드와 직전 프레임 상태 (None이면 다음 프레임은 전체 렌더링)
+        self.incremental = incremental
+        self._frame_state = None
+        
+        # (폰트, 글자, 색상)별로 그려 둔 글자 이미지 캐시 (가장 오래 안 쓴 것부터 제거)
+        self.text_cache_size = text_cache_size
+        self._text_cache = OrderedDict()
+        
+        # 다채로운 색상 정의
+        self.colors = {
+            'background': (15, 15, 35),  # 어두운 네이비 배경
+            'grid': (40, 40, 60),  # 어두운 회색 그리드
+            'block': (255, 255, 255),  # 흰색 블록 (기본)
+            'text': (255, 255, 255),  # 흰색 텍스트
+            'red': (255, 80, 80),  # 밝은 빨간색
+            'yellow': (255, 255, 100),  # 밝은 노란색
+            'green': (80, 255, 80),  # 밝은 초록색
+            'blue': (80, 80, 255),  # 밝은 파란색
+            'orange': (255, 180, 80),  # 밝은 주황색
+            'purple': (200, 80, 255),  # 밝은 보라색
+            'cyan': (80, 255, 255),  # 밝은 청록색
+            'pink': (255, 150, 200),  # 핑크색
+            'lime': (150, 255, 150),  # 라임색
+            'gold': (255, 215, 0),  # 금색
+            'silver': (192, 192, 192),  # 은색
+        }
+        
+        # 블록 타입별 색상 (매번 만들지 않도록 한 번만 생성)
+        self.block_colors = {
+            BlockType.I: self.colors['cyan'],  # I 블록: 밝은 청록색
+            BlockType.O: self.colors['yellow'],  # O 블록: 밝은 노란색
+            BlockType.T: self.colors['purple'],  # T 블록: 밝은 보라색
+            BlockType.S: self.colors['green'],  # S 블록: 밝은 초록색
+            BlockType.Z: self.colors['red'],  # Z 블록: 밝은 빨간색
+            BlockType.J: self.colors['blue'],  # J 블록: 밝은 파란색
+            BlockType.L: self.colors['orange'],  # L 블록: 밝은 주황색
+        }
+        
+        # 칸 크기별로 미리 그려 둔 블록 칸 이미지 ({칸 크기: {블록 타입: Surface}})
+        self._sprite_atlas = {}
+        
+        # 폰트 초기화 (D2Coding 폰트 사용)
+        try:
+            # D2Coding 폰트 사용 (한글 지원 우수)
+            self.font = pygame.font.SysFont('D2Coding', 28, bold=True)
+            self.small_font = pygame.font.SysFont('D2Coding', 20, bold=True)
+            print("D2Coding 폰트 사용 중")
+        except:
+            try:
+                # D2Coding이 없으면 D2Coding Ver1.3 시도
+                self.font = pygame.font.SysFont('D2Coding Ver1.3', 28, bold=True)
+                self.small_font = pygame.font.SysFont('D2Coding Ver1.3', 20, bold=True)
+                print("D2Coding Ver1.3 폰트 사용 중")
+            except:
+                try:
+                    # D2Coding이 없으면 맑은 고딕 시도
+                    self.font = pygame.font.SysFont('malgun gothic', 28, bold=True)
+                    self.small_font = pygame.font.SysFont('malgun gothic', 20, bold=True)
+                    print("맑은 고딕 폰트 사용 중")
+                except:
+                    # 모든 폰트가 실패하면 기본 폰트 사용
+                    self.font = pygame.font.Font(None, 28)
+                    self.small_font = pygame.font.Font(None, 20)
+                    print("기본 폰트 사용 중")
+        
+        # 게임 보드 크기 및 위치 (중앙 정렬)
+        self.board_width = 12  # 10 → 12 (15% 증가)
+        self.board_height = 20
+        self.cell_size = 35  # 기존 크기 유지
+        
+        # 보드 배경, 그리드, 컨트롤키 안내를 미리 그려 둔 정적 레이어 캐시
+        self._static_layer = None
+        self._static_layer_key = None
+        
+        self.update_layout()
+    
+    def update_layout(self):
+        """화면 크기, 보드 크기, 칸 크기에 맞춰 보드와 UI 위치를 다시 계산"""
+        # 중앙 정렬 계산
+        board_pixel_width = self.board_width * self.cell_size
+        board_pixel_height = self.board_height * self.cell_size
+        self.board_x = (self.width - board_pixel_width) // 2
+        self.board_y = (self.height - board_pixel_height) // 2 - 50  # 위로 50픽셀만 이동 (더 중앙에)
+        
+        # UI 영역 설정 (게임보드 오른쪽, 더 넓은 간격)
+        self.ui_x = self.board_x + board_pixel_width + 80  # 간격을 50에서 80으로 증가
+        self.ui_y = self.board_y
+        
+        # 컨트롤키 영역 설정 (게임보드 왼쪽, 더 넓은 간격)
+        self.controls_x = self.board_x - 300  # 간격을 250에서 300으로 증가
+        self.controls_y = self.board_y + 30   # 게임보드 상단에서 30픽셀 아래
+        
+        # 위치가 바뀌었으므로 다음 프레임은 전체 렌더링하고, 예전 칸 크기의 이미지는 버림
+        self._sprite_atlas = {}
+        self.invalidate()
+    
+    def render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        글자 이미지를 캐시에서 꺼내거나, 없으면 그려서 캐시에 저장
+        
+        Args:
+            font: 사용할 폰트
+            text: 그릴 글자
+            color: 글자 색상
+            
+        Returns:
+            pygame.Surface: 글자 이미지
+        """
+        key = (font, text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, color)
+        cache[key] = surface
+        if len(cache) > self.text_cache_size:
+            cache.popitem(last=False)
+        return surface
+    
+    def set_cell_size(self, cell_size: int):
+        """
+        칸 크기를 바꾸고 레이아웃을 다시 계산 (정적 레이어는 다음 프레임에 자동으로 다시 그림)
+        
+        Args:
+            cell_size: 새 칸 크기 (픽셀)
+        """
+        self.cell_size = cell_size
+        self.update_layout()
+    
+    def get_static_layer(self) -> pygame.Surface:
+        """
+        보드 배경, 그리드, 컨트롤키 안내를 그려 둔 화면 크기의 레이어를 반환
+        
+        칸 크기나 레이아웃이 바뀌면 자동으로 다시 그린다.
+        
+        Returns:
+            pygame.Surface: 정적 레이어
+        """
+        key = (
+            self.width, self.height, self.board_width, self.board_height, self.cell_size,
+            self.board_x, self.board_y, self.controls_x, self.controls_y,
+            self.colors['background'], self.colors['grid'],
+        )
+        if self._static_layer is None or self._static_layer_key != key:
+            layer = pygame.Surface((self.width, self.height)).convert()
+            layer.fill(self.colors['background'])
+            self._draw_board_background(layer)
+            self._draw_controls(layer)
+            self._static_layer = layer
+            self._static_layer_key = key
+        return self._static_layer
+    
+    def get_board_rect(self) -> pygame.Rect:
+        """보드가 차지하는 화면 영역"""
+        return pygame.Rect(
+            self.board_x,
+            self.board_y,
+            self.board_width * self.cell_size,
+            self.board_height * self.cell_size
+        )
+    
+    def get_controls_rect(self) -> pygame.Rect:
+        """컨트롤키 안내가 차지하는 화면 영역"""
+        return pygame.Rect(self.controls_x, self.controls_y, self.board_x - self.controls_x, 35 + 7 * 28)
+    
+    def render_game(self, game: Game):
+        """전체 게임 화면 렌더링"""
+        if self.incremental:
+            self.render_game_incremental(game)
+            return
+        
+        self.draw_full_frame(game)
+        
+        # 화면 업데이트
+        pygame.display.flip()
+    
+    def draw_full_frame(self, game: Game):
+        """화면 전체를 그림 (화면 업데이트는 호출한 쪽에서 처리)"""
+        # 배경, 보드 그리드, 컨트롤키 안내는 캐시된 레이어를 한 번에 복사
+        self.screen.blit(self.get_static_layer(), (0, 0))
+        
+        # 배치된 블록 그리기
+        self.render_board_cells(game.board)
+        
+        # 현재 블록 그리기 (보간 모드면 다음 낙하까지의 진행 비율만큼 아래로)
+        if game.current_block:
+            self.render_block(game.current_block, self.get_fall_offset(game))
+        
+        # 점수와 다음 블록 미리보기 그리기
+        self.render_stats(game)
+        self.render_next_block_preview(game)
+        
+        # 게임 오버 메시지
+        if game.game_over:
+            self.render_game_over_screen()
+        
+        # 일시정지 화면 그리기
+        if self.paused:
+            self.render_pause_screen()
+    
+    def invalidate(self):
+        """다음 프레임을 부분 렌더링 대신 전체 렌더링하도록 표시"""
+        self._frame_state = None
+    
+    def _collect_frame_state(self, game: Game) -> tuple:
+        """
+        부분 렌더링에서 비교할 현재 프레임 상태를 수집
+        
+        Returns:
+            tuple: (칸 값 리스트, 점수/레벨/줄 수, 다음 블록, 오버레이 상태)
+        """
+        # 배치된 블록과 현재 블록을 합친 칸 값 (y * board_width + x 위치)
+        cells = [cell for row in game.board.grid for cell in row]
+        block = game.current_block
+        if block:
+            for rel_x, rel_y in SHAPE_OFFSETS[block.block_type][block.rotation]:
+                x = block.x + rel_x
+                y = block.y + rel_y
+                if 0 <= x < self.board_width and 0 <= y < self.board_height:
+                    cells[y * self.board_width + x] = block.block_type
+        
+        next_block = game.get_next_block_preview()
+        next_state = (next_block.block_type, next_block.rotation) if next_block else None
+        stats = (game.score, game.level, game.lines_cleared)
+        overlay = (self.paused, game.game_over)
+        return cells, stats, next_state, overlay
+    
+    def render_game_incremental(self, game: Game):
+        """직전 프레임과 달라진 칸, UI 글자, 미리보기 영역만 다시 그림"""
+        state = self._collect_frame_state(game)
+        previous = self._frame_state
+        
+        if previous == state:
+            # 바뀐 것이 없으면 그리지도, 화면을 갱신하지도 않음
+            return
+        
+        cells, stats, next_state, overlay = state
+        if previous is None or any(overlay) or any(previous[3]):
+            # 첫 프레임이거나 반투명 오버레이가 있으면 전체를 다시 그림
+            self.draw_full_frame(game)
+            pygame.display.flip()
+            self._frame_state = state
+            return
+        
+        dirty_rects = []
+        
+        # 바뀐 보드 칸만 다시 그리기
+        previous_cells = previous[0]
+        for index, value in enumerate(cells):
+            if value != previous_cells[index]:
+                x, y = index % self.board_width, index // self.board_width
+                dirty_rects.append(self.render_board_cell(x, y, value))
+        
+        # 점수/레벨/줄 수가 바뀌었으면 해당 영역만 다시 그리기
+        if stats != previous[1]:
+            stats_rect = pygame.Rect(self.ui_x, self.ui_y, self.width - self.ui_x, 180)
+            self.screen.fill(self.colors['background'], stats_rect)
+            self.render_stats(game)
+            dirty_rects.append(stats_rect)
+        
+        # 다음 블록이 바뀌었으면 미리보기 영역만 다시 그리기
+        if next_state != previous[2]:
+            preview_rect = pygame.Rect(self.ui_x, self.ui_y + 180, self.width - self.ui_x, 40 + 4 * 30)
+            self.screen.fill(self.colors['background'], preview_rect)
+            self.render_next_block_preview(game)
+            dirty_rects.append(preview_rect)
+        
+        pygame.display.update(dirty_rects)
+        self._frame_state = state
+    
+    def render_board_cell(self, x: int, y: int, cell_value) -> pygame.Rect:
+        """
+        보드 칸 하나를 빈 칸 또는 블록으로 다시 그림
+        
+        Returns:
+            pygame.Rect: 다시 그린 화면 영역
+        """
+        cell_rect = pygame.Rect(
+            self.board_x + x * self.cell_size,
+            self.board_y + y * self.cell_size,
+            self.cell_size,
+            self.cell_size
+        )
+        if cell_value is None:
+            self.screen.blit(self.get_static_layer(), cell_rect, cell_rect)
+        else:
+            self.render_cell(x, y, cell_value)
+        return cell_rect
+    
+    def render_board(self, board: Board):
+        """게임 보드 렌더링"""
+        # 보드 배경과 그리드는 정적 레이어에서 복사
+        board_rect = self.get_board_rect()
+        self.screen.blit(self.get_static_layer(), board_rect, board_rect)
+        
+        # 배치된 블록들 그리기 (색상 유지)
+        self.render_board_cells(board)
+    
+    def render_board_cells(self, board: Board):
+        """보드에 배치된 블록 칸들 렌더링 (Surface.blits 한 번으로 묶어서 그림)"""
+        cell_size = self.cell_size
+        sprites = self._sprite_atlas.get(cell_size) or self._build_cell_sprites(cell_size)
+        default_sprite = sprites[None]
+        
+        blit_sequence = []
+        for y, row in enumerate(board.grid):
+            if y >= self.board_height:
+                break
+            screen_y = self.board_y + y * cell_size
+            for x, cell in enumerate(row):
+                if cell is not None and x < self.board_width:
+                    sprite = sprites.get(cell, default_sprite)
+                    blit_sequence.append((sprite, (self.board_x + x * cell_size, screen_y)))
+        
+        if blit_sequence:
+            self.screen.blits(blit_sequence, False)
+    
+    def _draw_board_background(self, surface: pygame.Surface):
+        """보드 배경과 그리드를 surface에 그림 (정적 레이어용)"""
+        # 보드 배경 그리기
+        board_rect = self.get_board_rect()
+        pygame.draw.rect(surface, self.colors['grid'], board_rect)
+        
+        # 보드 그리드 그리기
+        for x in range(self.board_width + 1):
+            start_pos = (self.board_x + x * self.cell_size, self.board_y)
+            end_pos = (self.board_x + x * self.cell_size, self.board_y + self.board_height * self.cell_size)
+            pygame.draw.line(surface, self.colors['grid'], start_pos, end_pos, 1)
+        
+        for y in range(self.board_height + 1):
+            start_pos = (self.board_x, self.board_y + y * self.cell_size)
+            end_pos = (self.board_x + self.board_width * self.cell_size, self.board_y + y * self.cell_size)
+            pygame.draw.line(surface, self.colors['grid'], start_pos, end_pos, 1)
+    
+    def get_block_color(self, block_type):
+        """블록 타입에 따른 색상 반환"""
+        return self.block_colors.get(block_type, self.colors['block'])
+    
+    def get_cell_sprite(self, cell_value, cell_size: int) -> pygame.Surface:
+        """
+        칸 값에 맞는 블록 칸 이미지를 반환 (채우기와 테두리를 미리 그려 둠)
+        
+        Args:
+            cell_value: BlockType 또는 타입 정보 없는 칸 값
+            cell_size: 칸 크기 (픽셀)
+            
+        Returns:
+            pygame.Surface: 블록 칸 이미지
+        """
+        sprites = self._sprite_atlas.get(cell_size)
+        if sprites is None:
+            sprites = self._build_cell_sprites(cell_size)
+        if isinstance(cell_value, BlockType):
+            return sprites[cell_value]
+        return sprites[None]  # 기본 흰색
+    
+    def _build_cell_sprites(self, cell_size: int) -> dict:
+        """칸 크기 하나에 대해 블록 타입별 칸 이미지를 만들어 저장"""
+        sprites = {}
+        for block_type in list(BlockType) + [None]:
+            sprite = pygame.Surface((cell_size, cell_size)).convert()
+            sprite.fill(self.get_block_color(block_type))
+            pygame.draw.rect(sprite, self.colors['grid'], sprite.get_rect(), 1)
+            sprites[block_type] = sprite
+        self._sprite_atlas[cell_size] = sprites
+        return sprites
+    
+    def get_fall_offset(self, game: Game) -> int:
+        """
+        프레임 보간용으로 현재 블록을 아래로 밀어 그릴 픽셀 수
+        
+        Returns:
+            int: 보간하지 않거나 블록이 더 내려갈 수 없으면 0
+        """
+        if not self.interpolate or self.paused or game.game_over or not game.can_move_block(0, 1):
+            return 0
+        progress = min(1.0, game.drop_time / game.get_drop_interval())
+        return int(progress * self.cell_size)
+    
+    def render_block(self, block: Block, y_offset: int = 0):
+        """
+        현재 블록 렌더링
+        
+        Args:
+            block: 그릴 블록
+            y_offset: 아래로 밀어 그릴 픽셀 수 (프레임 보간용)
+        """
+        sprite = self.get_cell_sprite(block.block_type, self.cell_size)
+        
+        # 블록의 각 셀을 그리기
+        for x, y in SHAPE_OFFSETS[block.block_type][block.rotation]:
+            screen_x = self.board_x + (block.x + x) * self.cell_size
+            screen_y = self.board_y + (block.y + y) * self.cell_size + y_offset
+            
+            # 블록이 보드 범위 내에 있을 때만 그리기
+            if 0 <= block.x + x < self.board_width and 0 <= block.y + y < self.board_height:
+                self.screen.blit(sprite, (screen_x, screen_y))
+    
+    def render_cell(self, x: int, y: int, cell_value):
+        """개별 셀 렌더링 (배치된 블록)"""
+        # 블록 타입에 따른 색상의 칸 이미지 적용
+        sprite = self.get_cell_sprite(cell_value, self.cell_size)
+        self.screen.blit(sprite, (self.board_x + x * self.cell_size, self.board_y + y * self.cell_size))
+    
+    def render_ui(self, game: Game):
+        """UI 요소 렌더링"""
+        # 점수, 레벨, 줄 수 표시
+        self.render_stats(game)
+        
+        # 다음 블록 미리보기
+        self.render_next_block_preview(game)
+        
+        # 컨트롤키 안내
+        self.render_controls()
+        
+        # 게임 오버 메시지
+        if game.game_over:
+            self.render_game_over_screen()
+    
+    def render_stats(self, game: Game):
+        """점수, 레벨, 삭제된 줄 수 렌더링"""
+        # 점수 표시 (금색, 더 큰 폰트)
+        score_text = self.render_text(self.font, f"점수: {game.score}", self.colors['gold'])
+        self.screen.blit(score_text, (self.ui_x, self.ui_y))
+        
+        # 레벨 표시 (파란색)
+        level_text = self.render_text(self.font, f"레벨: {game.level}", self.colors['blue'])
+        self.screen.blit(level_text, (self.ui_x, self.ui_y + 60))  # 간격 증가
+        
+        # 삭제된 줄 수 표시 (라임색)
+        lines_text = self.render_text(self.font, f"줄: {game.lines_cleared}", self.colors['lime'])
+        self.screen.blit(lines_text, (self.ui_x, self.ui_y + 120))  # 간격 증가
+    
+    def render_controls(self):
+        """컨트롤키 안내 렌더링 (정적 레이어에서 복사)"""
+        controls_rect = self.get_controls_rect()
+        self.screen.blit(self.get_static_layer(), controls_rect, controls_rect)
+    
+    def _draw_controls(self, surface: pygame.Surface):
+        """컨트롤키 안내를 surface에 그림 (정적 레이어용, 작은 폰트)"""
+        # 컨트롤키 제목
+        controls_title = self.render_text(self.small_font, "컨트롤:", self.colors['silver'])
+        surface.blit(controls_title, (self.controls_x, self.controls_y))
+        
+        # 컨트롤키 목록
+        controls = [
+            "← → : 블록 이동",
+            "↓ : 블록 빠른 낙하", 
+            "↑ : 블록 회전",
+            "스페이스 : 블록 즉시 낙하",
+            "P : 일시정지",
+            "R : 게임 재시작",
+            "ESC : 게임 종료"
+        ]
+        
+        for i, control in enumerate(controls):
+            control_text = self.render_text(self.small_font, control, self.colors['text'])
+            surface.blit(control_text, (self.controls_x, self.controls_y + 35 + i * 28))  # 간격 최적화
+    
+    def render_next_block_preview(self, game: Game):
+        """다음 블록 미리보기 렌더링"""
+        # 다음 블록 미리보기 영역
+        preview_x = self.ui_x
+        preview_y = self.ui_y + 180  # 간격 증가
+        
+        # 미리보기 제목 (은색, 작은 폰트)
+        preview_title = self.render_text(self.small_font, "다음 블록:", self.colors['silver'])
+        self.screen.blit(preview_title, (preview_x, preview_y))
+        
+        # 다음 블록 그리기
+        next_block = game.get_next_block_preview()
+        if next_block:
+            # 미리보기 블록을 중앙에 배치
+            preview_cell_size = 30  # 미리보기 블록 크기 조정
+            _, _, max_x, max_y = SHAPE_BOUNDS[next_block.block_type][next_block.rotation]
+            block_width = max_x + 1
+            block_height = max_y + 1
+            
+            center_x = preview_x + (4 * preview_cell_size - block_width * preview_cell_size) // 2
+            center_y = preview_y + 40  # 간격 조정
+            
+            self.render_preview_block(next_block, center_x, center_y, preview_cell_size)
+    
+    def render_preview_block(self, block: Block, x: int, y: int, cell_size: int = 20):
+        """미리보기 블록 렌더링"""
+        sprite = self.get_cell_sprite(block.block_type, cell_size)
+        
+        for block_x, block_y in SHAPE_OFFSETS[block.block_type][block.rotation]:
+            self.screen.blit(sprite, (x + block_x * cell_size, y + block_y * cell_size))
+    
+    def render_game_over_screen(self):
+        """게임 오버 화면 렌더링"""
+        # 반투명 오버레이
+        overlay = pygame.Surface((self.width, self.height))
+        overlay.set_alpha(128)
+        overlay.fill(self.colors['background'])
+        self.screen.blit(overlay, (0, 0))
+        
+        # 게임 오버 메시지
+        game_over_text = self.render_text(self.font, "게임 오버!", self.colors['red'])
+        text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
+        self.screen.blit(game_over_text, text_rect)
+        
+        # 재시작 안내
+        restart_text = self.render_text(self.font, "R키를 눌러 재시작", self.colors['text'])
+        restart_rect = restart_text.get_rect(center=(self.width // 2, self.height // 2 + 20))
+        self.screen.blit(restart_text, restart_rect)
+    
+    def cleanup(self):
+        """리소스 정리"""
+        pygame.quit()
+    
+    def handle_key_press(self, key: int, game: Game):
+        """키 입력 처리"""
+        if game.game_over:
+            if key == pygame.K_r:
+                game.reset_game()
+            return
+        
+        # 게임 컨트롤
+        if key == pygame.K_LEFT:
+            game.move_block_left()
+        elif key == pygame.K_RIGHT:
+            game.move_block_right()
+        elif key == pygame.K_DOWN:
+            game.move_block_down()
+        elif key == pygame.K_UP:
+            game.rotate_block()
+        elif key == pygame.K_SPACE:
+            game.drop_block_to_bottom()
+        elif key == pygame.K_p:
+            self.paused = not self.paused  # 최소한의 구현
+        elif key == pygame.K_r:
+            game.reset_game()
+        elif key == pygame.K_ESCAPE:
+            # ESC 키로 게임 종료
+            return False  # False를 반환하여 게임 루프 종료
+    
+    def handle_events(self, game: Game):
+        """키보드 이벤트 처리"""
+        for event in pygame.event.get():
+            if not self.handle_event(event, game):
+                return False
+        
+        return True
+    
+    def handle_event(self, event, game: Game) -> bool:
+        """
+        이벤트 하나 처리
+        
+        Returns:
+            bool: 게임 루프를 계속하면 True, 종료해야 하면 False
+        """
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.KEYDOWN:
+            result = self.handle_key_press(event.key, game)
+            if result is False:  # ESC 키나 다른 종료 조건
+                return False
+        return True
+    
+    def wait_while_idle(self, game: Game) -> bool:
+        """
+        일시정지나 게임 오버 상태에서 화면을 한 번만 그리고 입력이 올 때까지 잠듦
+        
+        입력이 오거나 상태가 바뀌면 바로 돌아오고, 제한 시간마다 한 번씩 깨어나
+        창 닫기 등을 놓치지 않도록 한다.
+        
+        Returns:
+            bool: 게임 루프를 계속하면 True, 종료해야 하면 False
+        """
+        self.render_game(game)
+        
+        while self.paused or game.game_over:
+            event = pygame.event.wait(self.idle_timeout_ms)
+            if event.type == pygame.NOEVENT:
+                continue
+            if not self.handle_event(event, game):
+                return False
+            # 입력으로 화면이 바뀌었을 수 있으므로 다시 그림 (예: 재시작)
+            self.render_game(game)
+        
+        return True
+    
+    def render_pause_screen(self):
+        """일시정지 화면 렌더링"""
+        # 반투명 오버레이
+        overlay = pygame.Surface((self.width, self.height))
+        overlay.set_alpha(128)
+        overlay.fill(self.colors['background'])
+        self.screen.blit(overlay, (0, 0))
+        
+        # 일시정지 메시지
+        pause_text = self.render_text(self.font, "일시정지", self.colors['yellow'])
+        text_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
+        self.screen.blit(pause_text, text_rect)
+        
+        # 재개 안내
+        resume_text = self.render_text(self.small_font, "P키를 눌러 재개", self.colors['green'])
+        resume_rect = resume_text.get_rect(center=(self.width // 2, self.height // 2 + 20))
+        self.screen.blit(resume_text, resume_rect)
+    
+    def run_game_loop(self, game: Game):
+        """메인 게임 루프 실행 (로직은 고정 간격, 렌더링은 fps 제한)"""
+        clock = pygame.time.Clock()
+        scheduler = FixedTimestepClock(self.logic_rate, self.max_catchup_steps)
+        running = True
+        
+        while running:
+            # 일시정지/게임 오버면 프레임 루프를 멈추고 입력을 기다림
+            if self.paused or game.game_over:
+                running = self.wait_while_idle(game)
+                # 잠들어 있던 시간은 따라잡지 않음
+                scheduler.reset()
+                clock.tick()
+                continue
+            
+            # 이벤트 처리
+            running = self.handle_events(game)
+            
+            # 흐른 시간만큼 고정 간격 로직 틱 실행 (일시정지가 아닐 때만)
+            steps = scheduler.update(pygame.time.get_ticks())
+            if not game.game_over and not self.paused:
+                for _ in range(steps):
+                    game.update(scheduler.step_ms)
+            
+            # 화면 렌더링
+            self.render_game(game)
+            
+            # FPS 제한
+            clock.tick(self.fps)
+        
+        self.cleanup()
+    
+    def update_game_logic(self, game: Game, current_time: int, last_drop_time: int):
+        """게임 로직 업데이트 (직전 호출 이후 흐른 시간만큼 게임 시간을 진행)"""
+        game.update(current_time - last_drop_time)
@@ -1,5 +1,5 @@
-import sys
-import os
-
-# 프로젝트 루트 디렉토리를 Python path에 추가
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,69 @@
+import pytest
+from game.batch import BatchSummary, iter_batch, play_game, run_batch
+
+
+def drop_every_tick(game):
+    """매 틱 블록을 즉시 떨어뜨리는 테스트용 입력 함수"""
+    return 'drop'
+
+
+class TestBatch:
+    """병렬 게임 실행기 테스트"""
+
+    def test_play_game_collects_results(self):
+        """게임 하나의 결과 항목이 모두 수집되는지 테스트"""
+        # Given & When
+        result = play_game(7, controller=drop_every_tick)
+
+        # Then
+        assert result['seed'] == 7
+        assert result['pieces_placed'] > 0
+        for field in ('score', 'level', 'lines_cleared', 'ticks'):
+            assert field in result
+
+    def test_play_game_same_seed_same_result(self):
+        """같은 시드로 진행하면 같은 결과가 나오는지 테스트"""
+        # Given & When
+        first = play_game(3, controller=drop_every_tick)
+        second = play_game(3, controller=drop_every_tick)
+
+        # Then
+        assert first == second
+
+    def test_summary_statistics(self):
+        """요약 통계가 평균, 최솟값, 최댓값을 올바르게 계산하는지 테스트"""
+        # Given
+        summary = BatchSummary(fields=('score',))
+
+        # When
+        for score in [100, 200, 300]:
+            summary.add({'score': score})
+        stats = summary.to_dict()
+
+        # Then
+        assert stats['games'] == 3
+        assert stats['score']['mean'] == pytest.approx(200)
+        assert stats['score']['stdev'] == pytest.approx(100)
+        assert stats['score']['min'] == 100
+        assert stats['score']['max'] == 300
+
+    def test_iter_batch_streams_every_game(self):
+        """프로세스 풀에서 모든 게임 결과가 하나씩 도착하는지 테스트"""
+        # Given & When
+        results = list(iter_batch(6, base_seed=10, workers=2, max_ticks=2000, chunk_size=2))
+
+        # Then
+        assert sorted(result['seed'] for result in results) == list(range(10, 16))
+
+    def test_run_batch_summary_and_callback(self):
+        """run_batch가 결과마다 콜백을 호출하고 요약을 반환하는지 테스트"""
+        # Given
+        received = []
+
+        # When
+        summary = run_batch(4, workers=2, max_ticks=2000, on_result=received.append)
+
+        # Then
+        assert summary['games'] == 4
+        assert len(received) == 4
+        assert summary['pieces_placed']['min'] > 0
@@ -0,0 +1,117 @@
+import pytest
+from game.block import Block, BlockType
+from game.board import Board
+from game.bitboard import BitBoard
+from game.game import Game
+
+
+class TestBitBoard:
+    """비트마스크 보드 클래스 테스트"""
+
+    def test_bitboard_creation(self):
+        """비트보드가 빈 상태로 생성되는지 테스트"""
+        # Given & When
+        board = BitBoard()
+
+        # Then
+        assert board.width == 12
+        assert board.height == 20
+        assert board.rows == [0] * 20
+        assert len(board.grid) == 20
+        assert len(board.grid[0]) == 12
+        assert all(all(cell is None for cell in row) for row in board.grid)
+
+    def test_place_block_sets_bits_and_colors(self):
+        """블록 배치 시 비트와 색상 평면이 함께 갱신되는지 테스트"""
+        # Given
+        board = BitBoard()
+        block = Block(BlockType.O, 5, 5)
+
+        # When
+        board.place_block(block)
+
+        # Then
+        assert board.rows[5] == 0b11 << 5
+        assert board.rows[6] == 0b11 << 5
+        assert board.grid[5][5] == BlockType.O
+        assert board.grid[6][6] == BlockType.O
+        assert board.is_empty(4, 5) == True
+        assert board.is_empty(5, 5) == False
+
+    def test_collision_matches_board(self):
+        """모든 블록/회전/위치에서 충돌 결과가 Board와 같은지 테스트"""
+        # Given
+        board = Board()
+        bitboard = BitBoard()
+        for obstacle in [Block(BlockType.T, 3, 15), Block(BlockType.I, 6, 10)]:
+            board.place_block(obstacle)
+            bitboard.place_block(obstacle)
+
+        # When & Then
+        for block_type in BlockType:
+            for rotation in range(4):
+                for x in range(-2, 13):
+                    for y in range(-2, 21):
+                        block = Block(block_type, x, y)
+                        block.rotation = rotation
+                        assert bitboard.check_collision(block) == board.check_collision(block)
+
+    def test_full_line_detection(self):
+        """가득 찬 줄이 전체 줄 상수와의 비교로 감지되는지 테스트"""
+        # Given
+        board = BitBoard()
+
+        # When
+        for x in range(board.width):
+            board.grid[19][x] = BlockType.I
+
+        # Then
+        assert board.rows[19] == board.full_row
+        assert board.get_full_lines() == [19]
+
+    def test_clear_lines_moves_blocks_down(self):
+        """줄 삭제 후 위의 블록과 색상이 아래로 이동하는지 테스트"""
+        # Given
+        board = BitBoard()
+        for line in [18, 19]:
+            for x in range(board.width):
+                board.grid[line][x] = BlockType.I
+        board.grid[17][5] = BlockType.T
+
+        # When
+        cleared = board.clear_full_lines()
+
+        # Then
+        assert cleared == 2
+        assert board.grid[19][5] == BlockType.T
+        assert board.grid[17][5] is None
+        assert board.rows[19] == 1 << 5
+        assert board.get_full_lines() == []
+
+    def test_remove_block(self):
+        """블록 제거 테스트"""
+        # Given
+        board = BitBoard()
+        block = Block(BlockType.L, 2, 2)
+        board.place_block(block)
+
+        # When
+        board.remove_block(block)
+
+        # Then
+        assert board.rows == [0] * 20
+        assert all(all(cell is None for cell in row) for row in board.grid)
+
+    def test_game_with_bitboard(self):
+        """Game이 BitBoard로 그대로 동작하는지 테스트"""
+        # Given
+        game = Game(board_class=BitBoard)
+        game.spawn_new_block()
+
+        # When
+        game.drop_block_to_bottom()
+        game.reset_game()
+
+        # Then
+        assert isinstance(game.board, BitBoard)
+        assert game.score == 0
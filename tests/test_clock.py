@@ -0,0 +1,69 @@
+import pytest
+from game.clock import FixedTimestepClock
+from game.game import Game
+
+
+class TestFixedTimestepClock:
+    """고정 간격 로직 스케줄러 테스트"""
+
+    def test_steps_from_accumulated_time(self):
+        """누적된 시간만큼 고정 틱 수를 돌려주는지 테스트"""
+        # Given
+        clock = FixedTimestepClock(tick_rate=100)  # 10ms 간격
+
+        # When & Then
+        assert clock.advance(25) == 2
+        assert clock.alpha == pytest.approx(0.5)
+        assert clock.advance(5) == 1
+        assert clock.total_steps == 3
+
+    def test_same_logic_rate_for_any_frame_rate(self):
+        """30Hz와 144Hz 렌더링에서 1초 동안 같은 로직 틱이 실행되는지 테스트"""
+        # Given
+        slow = FixedTimestepClock(tick_rate=60)
+        fast = FixedTimestepClock(tick_rate=60)
+
+        # When
+        slow_steps = sum(slow.advance(1000 / 30) for _ in range(30))
+        fast_steps = sum(fast.advance(1000 / 144) for _ in range(144))
+
+        # Then - 부동소수점 오차로 마지막 한 틱은 다음 프레임으로 넘어갈 수 있음
+        assert slow_steps in (59, 60)
+        assert fast_steps in (59, 60)
+
+    def test_catch_up_limit_drops_excess_time(self):
+        """너무 많이 밀리면 최대 틱 수만 실행하고 나머지는 버리는지 테스트"""
+        # Given
+        clock = FixedTimestepClock(tick_rate=60, max_steps_per_frame=5)
+
+        # When
+        steps = clock.advance(2000)
+
+        # Then
+        assert steps == 5
+        assert clock.accumulator < clock.step_ms
+
+    def test_update_uses_elapsed_between_calls(self):
+        """현재 시각 사이의 차이로 틱을 계산하는지 테스트"""
+        # Given
+        clock = FixedTimestepClock(tick_rate=50)  # 20ms 간격
+
+        # When & Then
+        assert clock.update(1000) == 0  # 첫 호출은 기준 시각만 기록
+        assert clock.update(1060) == 3
+
+    def test_game_update_drops_block_once_per_interval(self):
+        """게임 시간이 낙하 간격만큼 쌓이면 블록이 한 칸 떨어지는지 테스트"""
+        # Given
+        game = Game(seed=1)
+        game.spawn_new_block()
+        clock = FixedTimestepClock(tick_rate=60)
+
+        # When - 60Hz 프레임으로 1.5초가 흐름
+        for _ in range(90):
+            for _ in range(clock.advance(1000 / 60)):
+                game.update(clock.step_ms)
+
+        # Then
+        assert game.current_block.y == 1
+        assert game.drop_time == pytest.approx(500, abs=clock.step_ms)
@@ -0,0 +1,84 @@
+import pytest
+from game.block import BlockType
+from game.game import Game
+from game.generator import BagGenerator, UniformGenerator
+
+
+class TestPieceGenerator:
+    """블록 생성기 테스트"""
+
+    def test_same_seed_same_sequence(self):
+        """같은 시드는 같은 블록 순서를 만드는지 테스트"""
+        # Given
+        first = UniformGenerator(seed=42)
+        second = UniformGenerator(seed=42)
+
+        # When & Then
+        assert [first.next() for _ in range(50)] == [second.next() for _ in range(50)]
+
+    def test_bag_contains_each_type_once(self):
+        """7-bag 생성기가 7개마다 모든 블록을 한 번씩 내는지 테스트"""
+        # Given
+        generator = BagGenerator(seed=1)
+
+        # When
+        sequence = [generator.next() for _ in range(21)]
+
+        # Then
+        for start in range(0, 21, 7):
+            assert set(sequence[start:start + 7]) == set(BlockType)
+
+    def test_peek_does_not_consume(self):
+        """미리보기는 블록을 꺼내지 않고 순서를 그대로 유지하는지 테스트"""
+        # Given
+        generator = BagGenerator(seed=5, preview_size=3)
+
+        # When
+        preview = generator.peek(5)
+
+        # Then
+        assert len(preview) == 5
+        assert [generator.next() for _ in range(5)] == preview
+
+    def test_generate_into_matches_next(self):
+        """대량 생성이 next를 반복한 것과 같은 순서인지 테스트"""
+        # Given
+        bulk = UniformGenerator(seed=9, preview_size=4)
+        single = UniformGenerator(seed=9, preview_size=4)
+        out = [None] * 30
+
+        # When
+        bulk.generate_into(out)
+
+        # Then
+        assert out == [single.next() for _ in range(30)]
+        assert bulk.next() == single.next()
+
+    def test_game_uses_seeded_generator(self):
+        """같은 시드의 게임은 같은 블록 순서로 진행되는지 테스트"""
+        # Given
+        first = Game(seed=7)
+        second = Game(seed=7)
+
+        # When
+        first.spawn_new_block()
+        second.spawn_new_block()
+
+        # Then
+        assert first.current_block.block_type == second.current_block.block_type
+        assert first.get_preview(4) == second.get_preview(4)
+
+    def test_game_preview_starts_with_next_block(self):
+        """게임 미리보기의 첫 블록이 다음 블록인지 테스트"""
+        # Given
+        game = Game(generator=BagGenerator(seed=3, preview_size=5))
+        game.spawn_new_block()
+
+        # When
+        preview = game.get_preview(5)
+
+        # Then
+        assert preview[0] == game.next_block.block_type
+        game.drop_block_to_bottom()
+        assert game.current_block.block_type == preview[0]
+        assert game.next_block.block_type == preview[1]
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import pytest
+from game.game import Game
+from game.headless import HeadlessRunner
+
+
+class TestHeadlessRunner:
+    """화면 없는 게임 실행기 테스트"""
+
+    def test_headless_import_without_pygame(self):
+        """headless 모듈이 pygame을 불러오지 않는지 테스트"""
+        # Given
+        code = "import sys, game.headless; print('pygame' in sys.modules)"
+
+        # When
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=root)
+
+        # Then
+        assert output.stdout.strip() == "False"
+
+    def test_runner_spawns_first_block(self):
+        """실행기가 첫 블록을 생성하는지 테스트"""
+        # Given
+        game = Game()
+
+        # When
+        HeadlessRunner(game)
+
+        # Then
+        assert game.current_block is not None
+
+    def test_gravity_uses_simulated_clock(self):
+        """가상 시계 기준 낙하 간격마다 블록이 한 칸씩 떨어지는지 테스트"""
+        # Given
+        game = Game()
+        runner = HeadlessRunner(game, tick_ms=100)
+
+        # When - 1000ms 낙하 간격의 10틱 = 1초
+        for _ in range(10):
+            runner.step()
+
+        # Then
+        assert game.current_block.y == 1
+
+    def test_scripted_inputs_applied_at_tick(self):
+        """(틱, 입력) 목록이 해당 틱에 적용되는지 테스트"""
+        # Given
+        game = Game()
+        runner = HeadlessRunner(game, inputs=[(0, 'left'), (2, 'right'), (2, 'right')])
+        initial_x = game.current_block.x
+
+        # When & Then
+        runner.step()
+        assert game.current_block.x == initial_x - 1
+        runner.step()
+        assert game.current_block.x == initial_x - 1
+        runner.step()
+        assert game.current_block.x == initial_x + 1
+
+    def test_controller_function_inputs(self):
+        """입력 함수가 매 틱 호출되는지 테스트"""
+        # Given
+        game = Game()
+        runner = HeadlessRunner(game, inputs=lambda g: 'drop')
+
+        # When
+        runner.step()
+
+        # Then
+        assert any(any(cell is not None for cell in row) for row in game.board.grid)
+
+    def test_unknown_action_raises(self):
+        """알 수 없는 입력은 ValueError를 발생시키는지 테스트"""
+        # Given
+        runner = HeadlessRunner(Game())
+
+        # When & Then
+        with pytest.raises(ValueError):
+            runner.apply_action('jump')
+
+    def test_run_until_game_over_reports_speed(self):
+        """게임 오버까지 진행하고 초당 틱 수를 보고하는지 테스트"""
+        # Given
+        runner = HeadlessRunner(Game(), inputs=lambda g: 'drop')
+
+        # When
+        result = runner.run(max_ticks=10000)
+
+        # Then
+        assert result['game_over'] == True
+        assert result['ticks'] > 0
+        assert result['ticks_per_second'] > 0
@@ -1,432 +1,836 @@
-import pytest
-import pygame
-from unittest.mock import Mock, patch
-from game.game import Game
-from game.block import Block, BlockType
-from game.board import Board
-from game.renderer import GameRenderer
-
-class TestGameRenderer:
-    """게임 렌더링 테스트"""
-    
-    def test_game_screen_initialization(self):
-        """게임 화면 초기화 테스트"""
-        # Given
-        pygame.init()
-        
-        # When
-        screen = pygame.display.set_mode((800, 600))
-        
-        # Then
-        assert screen is not None
-        assert screen.get_width() == 800
-        assert screen.get_height() == 600
-        
-        pygame.quit()
-    
-    def test_block_rendering(self):
-        """블록 그리기 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        block = Block(BlockType.I, 0, 0)
-        
-        # When
-        screen.fill((0, 0, 0))  # 검은색 배경
-        # 블록을 그리는 로직 (아직 구현되지 않음)
-        
-        # Then
-        # 화면이 올바르게 그려졌는지 확인
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_board_rendering(self):
-        """게임 보드 그리기 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        board = Board()
-        
-        # When
-        screen.fill((0, 0, 0))  # 검은색 배경
-        # 보드를 그리는 로직 (아직 구현되지 않음)
-        
-        # Then
-        # 화면이 올바르게 그려졌는지 확인
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_ui_elements_rendering(self):
-        """UI 요소 그리기 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        
-        # When
-        screen.fill((0, 0, 0))  # 검은색 배경
-        # UI 요소를 그리는 로직 (아직 구현되지 않음)
-        
-        # Then
-        # 화면이 올바르게 그려졌는지 확인
-        assert screen is not None
-        
-        pygame.quit()
-
-    def test_score_display(self):
-        """점수 표시 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        game.score = 1500
-        
-        # When
-        screen.fill((0, 0, 0))
-        # 점수 표시 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_level_display(self):
-        """레벨 표시 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        game.level = 3
-        
-        # When
-        screen.fill((0, 0, 0))
-        # 레벨 표시 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_next_block_preview(self):
-        """다음 블록 미리보기 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        
-        # When
-        screen.fill((0, 0, 0))
-        # 다음 블록 미리보기 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_game_over_screen(self):
-        """게임 오버 화면 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        game.game_over = True
-        
-        # When
-        screen.fill((0, 0, 0))
-        # 게임 오버 화면 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-
-    def test_keyboard_events(self):
-        """키보드 이벤트 처리 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        
-        # When
-        # 키보드 이벤트 처리 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_game_controls(self):
-        """게임 컨트롤 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        
-        # When
-        # 게임 컨트롤 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-
-    def test_game_loop_initialization(self):
-        """게임 루프 초기화 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        
-        # When
-        # 게임 루프 초기화 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_game_loop_events(self):
-        """게임 루프 이벤트 처리 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        
-        # When
-        # 게임 루프 이벤트 처리 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-    
-    def test_game_loop_rendering(self):
-        """게임 루프 렌더링 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        game = Game()
-        
-        # When
-        # 게임 루프 렌더링 로직 (아직 구현되지 않음)
-        
-        # Then
-        assert screen is not None
-        
-        pygame.quit()
-
-    def test_block_colors(self):
-        """블록 색상 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        renderer = GameRenderer()
-        
-        # When
-        colors = renderer.colors
-        
-        # Then
-        assert 'background' in colors
-        assert 'grid' in colors
-        assert 'block' in colors
-        assert 'text' in colors
-        assert colors['background'] == (0, 0, 0)  # 검은색 배경
-        assert colors['block'] == (255, 255, 255)  # 흰색 블록
-        assert colors['text'] == (255, 255, 255)  # 흰색 텍스트
-        assert colors['grid'] == (50, 50, 50)  # 회색 그리드
-        
-        pygame.quit()
-    
-    def test_ui_text_colors(self):
-        """UI 텍스트 색상 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        renderer = GameRenderer()
-        game = Game()
-        
-        # When
-        screen.fill(renderer.colors['background'])
-        renderer.render_ui(game)
-        
-        # Then
-        # UI 텍스트가 올바른 색상으로 렌더링되었는지 확인
-        assert screen is not None
-        assert renderer.colors['text'] == (255, 255, 255)  # 흰색 텍스트
-        
-        pygame.quit()
-    
-    def test_game_over_screen_colors(self):
-        """게임 오버 화면 색상 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        renderer = GameRenderer()
-        game = Game()
-        game.game_over = True
-        
-        # When
-        screen.fill(renderer.colors['background'])
-        renderer.render_game_over_screen()
-        
-        # Then
-        # 게임 오버 화면이 올바른 색상으로 렌더링되었는지 확인
-        assert screen is not None
-        assert renderer.colors['text'] == (255, 255, 255)  # 흰색 텍스트
-        
-        pygame.quit()
-    
-    def test_board_colors(self):
-        """게임 보드 색상 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        renderer = GameRenderer()
-        board = Board()
-        
-        # When
-        screen.fill(renderer.colors['background'])
-        renderer.render_board(board)
-        
-        # Then
-        # 보드가 올바른 색상으로 렌더링되었는지 확인
-        assert screen is not None
-        assert renderer.colors['grid'] == (50, 50, 50)  # 회색 그리드
-        
-        pygame.quit()
-    
-    def test_block_rendering_colors(self):
-        """블록 렌더링 색상 테스트"""
-        # Given
-        pygame.init()
-        screen = pygame.display.set_mode((800, 600))
-        renderer = GameRenderer()
-        block = Block(BlockType.I, 0, 0)
-        
-        # When
-        screen.fill(renderer.colors['background'])
-        renderer.render_block(block)
-        
-        # Then
-        # 블록이 올바른 색상으로 렌더링되었는지 확인
-        assert screen is not None
-        assert renderer.colors['block'] == (255, 255, 255)  # 흰색 블록
-        
-        pygame.quit()
-
-    def test_arrow_key_controls(self):
-        """화살표 키 컨트롤 테스트"""
-        # Given
-        pygame.init()
-        game = Game()
-        renderer = GameRenderer()
-        game.spawn_new_block()
-        initial_x = game.current_block.x
-        initial_y = game.current_block.y
-        
-        # When & Then - 왼쪽 화살표
-        renderer.handle_key_press(pygame.K_LEFT, game)
-        assert game.current_block.x == initial_x - 1
-        
-        # When & Then - 오른쪽 화살표
-        renderer.handle_key_press(pygame.K_RIGHT, game)
-        assert game.current_block.x == initial_x
-        
-        # When & Then - 아래 화살표
-        renderer.handle_key_press(pygame.K_DOWN, game)
-        assert game.current_block.y == initial_y + 1
-        
-        # When & Then - 위 화살표 (회전)
-        initial_rotation = game.current_block.rotation
-        renderer.handle_key_press(pygame.K_UP, game)
-        assert game.current_block.rotation == (initial_rotation + 1) % 4
-        
-        pygame.quit()
-
-    def test_space_key_control(self):
-        """스페이스바 즉시 낙하 테스트"""
-        # Given
-        pygame.init()
-        game = Game()
-        renderer = GameRenderer()
-        game.spawn_new_block()
-        
-        # When
-        renderer.handle_key_press(pygame.K_SPACE, game)
-        
-        # Then
-        # 블록이 바닥까지 떨어졌는지 확인
-        assert game.current_block is None or game.current_block.y > 0
-        
-        pygame.quit()
-
-    def test_r_key_restart(self):
-        """R키 게임 재시작 테스트"""
-        # Given
-        pygame.init()
-        game = Game()
-        renderer = GameRenderer()
-        game.score = 1000
-        game.game_over = True
-        
-        # When
-        renderer.handle_key_press(pygame.K_r, game)
-        
-        # Then
-        assert game.score == 0
-        assert game.game_over == False
-        
-        pygame.quit()
-
-    def test_escape_key_exit(self):
-        """ESC 키 게임 종료 테스트"""
-        # Given
-        pygame.init()
-        game = Game()
-        renderer = GameRenderer()
-        
-        # When
-        result = renderer.handle_key_press(pygame.K_ESCAPE, game)
-        
-        # Then
-        # ESC 키가 False를 반환하여 게임 종료 신호를 보내는지 확인
-        assert result is False
-        
-        pygame.quit()
-
-def test_p_key_pause_red(self):
-    """P키 일시정지 테스트 (TDD Red 단계)"""
-    # Given
-    pygame.init()
-    game = Game()
-    renderer = GameRenderer()
-    
-    # When
-    renderer.handle_key_press(pygame.K_p, game)
-    
-    # Then
-    # 이 테스트는 아직 paused 속성이 없어서 실패해야 함
-    assert hasattr(renderer, 'paused')
-    assert renderer.paused == True
-    
-    pygame.quit()
-
-def test_pause_screen_rendering_red(self):
-    """일시정지 화면 렌더링 테스트 (TDD Red 단계)"""
-    # Given
-    pygame.init()
-    screen = pygame.display.set_mode((800, 600))
-    renderer = GameRenderer()
-    game = Game()
-    
-    # When
-    renderer.paused = True  # 강제로 일시정지 상태 설정
-    renderer.render_game(game)
-    
-    # Then
-    # 이 테스트는 render_pause_screen 메서드가 없어서 실패해야 함
-    assert hasattr(renderer, 'render_pause_screen')
-    
-    pygame.quit()
+import pytest
+import pygame
+from unittest.mock import Mock, patch
+from game.game import Game
+from game.block import Block, BlockType
+from game.board import Board
+from game.renderer import GameRenderer
+
+class TestGameRenderer:
+    """게임 렌더링 테스트"""
+    
+    def test_game_screen_initialization(self):
+        """게임 화면 초기화 테스트"""
+        # Given
+        pygame.init()
+        
+        # When
+        screen = pygame.display.set_mode((800, 600))
+        
+        # Then
+        assert screen is not None
+        assert screen.get_width() == 800
+        assert screen.get_height() == 600
+        
+        pygame.quit()
+    
+    def test_block_rendering(self):
+        """블록 그리기 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        block = Block(BlockType.I, 0, 0)
+        
+        # When
+        screen.fill((0, 0, 0))  # 검은색 배경
+        # 블록을 그리는 로직 (아직 구현되지 않음)
+        
+        # Then
+        # 화면이 올바르게 그려졌는지 확인
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_board_rendering(self):
+        """게임 보드 그리기 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        board = Board()
+        
+        # When
+        screen.fill((0, 0, 0))  # 검은색 배경
+        # 보드를 그리는 로직 (아직 구현되지 않음)
+        
+        # Then
+        # 화면이 올바르게 그려졌는지 확인
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_ui_elements_rendering(self):
+        """UI 요소 그리기 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        
+        # When
+        screen.fill((0, 0, 0))  # 검은색 배경
+        # UI 요소를 그리는 로직 (아직 구현되지 않음)
+        
+        # Then
+        # 화면이 올바르게 그려졌는지 확인
+        assert screen is not None
+        
+        pygame.quit()
+
+    def test_score_display(self):
+        """점수 표시 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        game.score = 1500
+        
+        # When
+        screen.fill((0, 0, 0))
+        # 점수 표시 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_level_display(self):
+        """레벨 표시 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        game.level = 3
+        
+        # When
+        screen.fill((0, 0, 0))
+        # 레벨 표시 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_next_block_preview(self):
+        """다음 블록 미리보기 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        
+        # When
+        screen.fill((0, 0, 0))
+        # 다음 블록 미리보기 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_game_over_screen(self):
+        """게임 오버 화면 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        game.game_over = True
+        
+        # When
+        screen.fill((0, 0, 0))
+        # 게임 오버 화면 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+
+    def test_keyboard_events(self):
+        """키보드 이벤트 처리 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        
+        # When
+        # 키보드 이벤트 처리 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_game_controls(self):
+        """게임 컨트롤 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        
+        # When
+        # 게임 컨트롤 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+
+    def test_game_loop_initialization(self):
+        """게임 루프 초기화 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        
+        # When
+        # 게임 루프 초기화 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_game_loop_events(self):
+        """게임 루프 이벤트 처리 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        
+        # When
+        # 게임 루프 이벤트 처리 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+    
+    def test_game_loop_rendering(self):
+        """게임 루프 렌더링 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        game = Game()
+        
+        # When
+        # 게임 루프 렌더링 로직 (아직 구현되지 않음)
+        
+        # Then
+        assert screen is not None
+        
+        pygame.quit()
+
+    def test_block_colors(self):
+        """블록 색상 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        renderer = GameRenderer()
+        
+        # When
+        colors = renderer.colors
+        
+        # Then
+        assert 'background' in colors
+        assert 'grid' in colors
+        assert 'block' in colors
+        assert 'text' in colors
+        assert colors['background'] == (0, 0, 0)  # 검은색 배경
+        assert colors['block'] == (255, 255, 255)  # 흰색 블록
+        assert colors['text'] == (255, 255, 255)  # 흰색 텍스트
+        assert colors['grid'] == (50, 50, 50)  # 회색 그리드
+        
+        pygame.quit()
+    
+    def test_ui_text_colors(self):
+        """UI 텍스트 색상 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        renderer = GameRenderer()
+        game = Game()
+        
+        # When
+        screen.fill(renderer.colors['background'])
+        renderer.render_ui(game)
+        
+        # Then
+        # UI 텍스트가 올바른 색상으로 렌더링되었는지 확인
+        assert screen is not None
+        assert renderer.colors['text'] == (255, 255, 255)  # 흰색 텍스트
+        
+        pygame.quit()
+    
+    def test_game_over_screen_colors(self):
+        """게임 오버 화면 색상 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        renderer = GameRenderer()
+        game = Game()
+        game.game_over = True
+        
+        # When
+        screen.fill(renderer.colors['background'])
+        renderer.render_game_over_screen()
+        
+        # Then
+        # 게임 오버 화면이 올바른 색상으로 렌더링되었는지 확인
+        assert screen is not None
+        assert renderer.colors['text'] == (255, 255, 255)  # 흰색 텍스트
+        
+        pygame.quit()
+    
+    def test_board_colors(self):
+        """게임 보드 색상 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        renderer = GameRenderer()
+        board = Board()
+        
+        # When
+        screen.fill(renderer.colors['background'])
+        renderer.render_board(board)
+        
+        # Then
+        # 보드가 올바른 색상으로 렌더링되었는지 확인
+        assert screen is not None
+        assert renderer.colors['grid'] == (50, 50, 50)  # 회색 그리드
+        
+        pygame.quit()
+    
+    def test_block_rendering_colors(self):
+        """블록 렌더링 색상 테스트"""
+        # Given
+        pygame.init()
+        screen = pygame.display.set_mode((800, 600))
+        renderer = GameRenderer()
+        block = Block(BlockType.I, 0, 0)
+        
+        # When
+        screen.fill(renderer.colors['background'])
+        renderer.render_block(block)
+        
+        # Then
+        # 블록이 올바른 색상으로 렌더링되었는지 확인
+        assert screen is not None
+        assert renderer.colors['block'] == (255, 255, 255)  # 흰색 블록
+        
+        pygame.quit()
+
+    def test_arrow_key_controls(self):
+        """화살표 키 컨트롤 테스트"""
+        # Given
+        pygame.init()
+        game = Game()
+        renderer = GameRenderer()
+        game.spawn_new_block()
+        initial_x = game.current_block.x
+        initial_y = game.current_block.y
+        
+        # When & Then - 왼쪽 화살표
+        renderer.handle_key_press(pygame.K_LEFT, game)
+        assert game.current_block.x == initial_x - 1
+        
+        # When & Then - 오른쪽 화살표
+        renderer.handle_key_press(pygame.K_RIGHT, game)
+        assert game.current_block.x == initial_x
+        
+        # When & Then - 아래 화살표
+        renderer.handle_key_press(pygame.K_DOWN, game)
+        assert game.current_block.y == initial_y + 1
+        
+        # When & Then - 위 화살표 (회전)
+        initial_rotation = game.current_block.rotation
+        renderer.handle_key_press(pygame.K_UP, game)
+        assert game.current_block.rotation == (initial_rotation + 1) % 4
+        
+        pygame.quit()
+
+    def test_space_key_control(self):
+        """스페이스바 즉시 낙하 테스트"""
+        # Given
+        pygame.init()
+        game = Game()
+        renderer = GameRenderer()
+        game.spawn_new_block()
+        
+        # When
+        renderer.handle_key_press(pygame.K_SPACE, game)
+        
+        # Then
+        # 블록이 바닥까지 떨어졌는지 확인
+        assert game.current_block is None or game.current_block.y > 0
+        
+        pygame.quit()
+
+    def test_r_key_restart(self):
+        """R키 게임 재시작 테스트"""
+        # Given
+        pygame.init()
+        game = Game()
+        renderer = GameRenderer()
+        game.score = 1000
+        game.game_over = True
+        
+        # When
+        renderer.handle_key_press(pygame.K_r, game)
+        
+        # Then
+        assert game.score == 0
+        assert game.game_over == False
+        
+        pygame.quit()
+
+    def test_escape_key_exit(self):
+        """ESC 키 게임 종료 테스트"""
+        # Given
+        pygame.init()
+        game = Game()
+        renderer = GameRenderer()
+        
+        # When
+        result = renderer.handle_key_press(pygame.K_ESCAPE, game)
+        
+        # Then
+        # ESC 키가 False를 반환하여 게임 종료 신호를 보내는지 확인
+        assert result is False
+        
+        pygame.quit()
+
+def test_p_key_pause_red(self):
+    """P키 일시정지 테스트 (TDD Red 단계)"""
+    # Given
+    pygame.init()
+    game = Game()
+    renderer = GameRenderer()
+    
+    # When
+    renderer.handle_key_press(pygame.K_p, game)
+    
+    # Then
+    # 이 테스트는 아직 paused 속성이 없어서 실패해야 함
+    assert hasattr(renderer, 'paused')
+    assert renderer.paused == True
+    
+    pygame.quit()
+
+def test_pause_screen_rendering_red(self):
+    """일시정지 화면 렌더링 테스트 (TDD Red 단계)"""
+    # Given
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    renderer = GameRenderer()
+    game = Game()
+    
+    # When
+    renderer.paused = True  # 강제로 일시정지 상태 설정
+    renderer.render_game(game)
+    
+    # Then
+    # 이 테스트는 render_pause_screen 메서드가 없어서 실패해야 함
+    assert hasattr(renderer, 'render_pause_screen')
+    
+    pygame.quit()
+
+
+class TestIncrementalRendering:
+    """부분 렌더링 모드 테스트"""
+    
+    def test_first_frame_is_full_render(self):
+        """첫 프레임은 전체를 그리고 flip하는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer(incremental=True)
+        game = Game()
+        game.spawn_new_block()
+        
+        # When
+        with patch('pygame.display.flip') as flip, patch('pygame.display.update') as update:
+            renderer.render_game(game)
+        
+        # Then
+        flip.assert_called_once()
+        update.assert_not_called()
+        
+        pygame.quit()
+    
+    def test_unchanged_frame_skips_update(self):
+        """바뀐 것이 없으면 화면을 갱신하지 않는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer(incremental=True)
+        game = Game()
+        game.spawn_new_block()
+        renderer.render_game(game)
+        
+        # When
+        with patch('pygame.display.flip') as flip, patch('pygame.display.update') as update:
+            renderer.render_game(game)
+        
+        # Then
+        flip.assert_not_called()
+        update.assert_not_called()
+        
+        pygame.quit()
+    
+    def test_moved_block_updates_only_changed_cells(self):
+        """블록 이동 시 바뀐 칸 영역만 갱신하는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer(incremental=True)
+        game = Game()
+        game.spawn_new_block()
+        renderer.render_game(game)
+        
+        # When
+        game.move_block_down()
+        with patch('pygame.display.flip') as flip, patch('pygame.display.update') as update:
+            renderer.render_game(game)
+        
+        # Then
+        flip.assert_not_called()
+        rects = update.call_args[0][0]
+        assert 0 < len(rects) <= 8  # 블록 4칸이 빠진 칸 + 새로 채운 칸
+        assert all(rect.width == renderer.cell_size for rect in rects)
+        
+        pygame.quit()
+    
+    def test_score_change_updates_stats_region(self):
+        """점수가 바뀌면 점수 영역이 갱신되는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer(incremental=True)
+        game = Game()
+        game.spawn_new_block()
+        renderer.render_game(game)
+        
+        # When
+        game.score += 100
+        with patch('pygame.display.update') as update:
+            renderer.render_game(game)
+        
+        # Then
+        rects = update.call_args[0][0]
+        assert len(rects) == 1
+        assert rects[0].topleft == (renderer.ui_x, renderer.ui_y)
+        
+        pygame.quit()
+    
+    def test_pause_forces_full_render(self):
+        """일시정지 오버레이는 전체 렌더링으로 그리는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer(incremental=True)
+        game = Game()
+        game.spawn_new_block()
+        renderer.render_game(game)
+        
+        # When
+        renderer.paused = True
+        with patch('pygame.display.flip') as flip:
+            renderer.render_game(game)
+        
+        # Then
+        flip.assert_called_once()
+        
+        pygame.quit()
+
+
+class TestStaticLayerCache:
+    """정적 배경 레이어 캐시 테스트"""
+    
+    def test_static_layer_reused_between_frames(self):
+        """레이아웃이 그대로면 같은 레이어를 재사용하는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        game = Game()
+        
+        # When
+        renderer.render_game(game)
+        first = renderer.get_static_layer()
+        renderer.render_game(game)
+        
+        # Then
+        assert renderer.get_static_layer() is first
+        
+        pygame.quit()
+    
+    def test_static_layer_rebuilt_on_cell_size_change(self):
+        """칸 크기가 바뀌면 레이어를 다시 그리는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        first = renderer.get_static_layer()
+        
+        # When
+        renderer.set_cell_size(30)
+        
+        # Then
+        assert renderer.get_static_layer() is not first
+        assert renderer.get_board_rect().width == renderer.board_width * 30
+        
+        pygame.quit()
+    
+    def test_static_layer_contains_board_and_background(self):
+        """레이어에 보드 배경과 화면 배경이 그려져 있는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        
+        # When
+        layer = renderer.get_static_layer()
+        
+        # Then
+        board_center = renderer.get_board_rect().center
+        assert layer.get_at(board_center)[:3] == renderer.colors['grid']
+        assert layer.get_at((0, 0))[:3] == renderer.colors['background']
+        
+        pygame.quit()
+    
+    def test_full_frame_does_not_redraw_grid_lines(self):
+        """전체 프레임에서 그리드 선을 매번 다시 그리지 않는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        game = Game()
+        renderer.render_game(game)
+        
+        # When
+        with patch('pygame.draw.line') as draw_line:
+            renderer.render_game(game)
+        
+        # Then
+        draw_line.assert_not_called()
+        
+        pygame.quit()
+
+
+class TestTextCache:
+    """글자 이미지 캐시 테스트"""
+    
+    def test_same_text_rendered_once(self):
+        """같은 (폰트, 글자, 색상)은 한 번만 그리는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        renderer.font = Mock(wraps=renderer.font)
+        
+        # When
+        first = renderer.render_text(renderer.font, "점수: 0", renderer.colors['gold'])
+        second = renderer.render_text(renderer.font, "점수: 0", renderer.colors['gold'])
+        
+        # Then
+        assert first is second
+        assert renderer.font.render.call_count == 1
+        
+        pygame.quit()
+    
+    def test_changed_value_renders_new_surface(self):
+        """값이 바뀐 글자는 새로 그리는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        
+        # When
+        first = renderer.render_text(renderer.font, "점수: 0", renderer.colors['gold'])
+        second = renderer.render_text(renderer.font, "점수: 100", renderer.colors['gold'])
+        
+        # Then
+        assert first is not second
+        
+        pygame.quit()
+    
+    def test_least_recently_used_evicted(self):
+        """캐시가 가득 차면 가장 오래 안 쓴 글자부터 제거되는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer(text_cache_size=2)
+        color = renderer.colors['text']
+        renderer.render_text(renderer.font, "A", color)
+        renderer.render_text(renderer.font, "B", color)
+        
+        # When - A를 다시 사용한 뒤 C를 추가
+        renderer.render_text(renderer.font, "A", color)
+        renderer.render_text(renderer.font, "C", color)
+        
+        # Then
+        keys = [key[1] for key in renderer._text_cache]
+        assert keys == ["A", "C"]
+        
+        pygame.quit()
+    
+    def test_repeated_frames_do_not_rerender_labels(self):
+        """점수가 그대로면 다음 프레임에서 글자를 다시 그리지 않는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        renderer.font = Mock(wraps=renderer.font)
+        game = Game()
+        renderer.render_game(game)
+        renderer.font.render.reset_mock()
+        
+        # When
+        renderer.render_game(game)
+        
+        # Then
+        renderer.font.render.assert_not_called()
+        
+        pygame.quit()
+
+
+class TestCellSprites:
+    """블록 칸 이미지 테스트"""
+    
+    def test_sprite_has_block_color_and_border(self):
+        """칸 이미지가 블록 색상과 테두리로 그려지는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        
+        # When
+        sprite = renderer.get_cell_sprite(BlockType.T, renderer.cell_size)
+        
+        # Then
+        assert sprite.get_size() == (renderer.cell_size, renderer.cell_size)
+        assert sprite.get_at((renderer.cell_size // 2, renderer.cell_size // 2))[:3] == renderer.colors['purple']
+        assert sprite.get_at((0, 0))[:3] == renderer.colors['grid']
+        
+        pygame.quit()
+    
+    def test_sprites_cached_per_cell_size(self):
+        """같은 칸 크기에서는 같은 이미지를 재사용하는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        
+        # When
+        first = renderer.get_cell_sprite(BlockType.I, renderer.cell_size)
+        second = renderer.get_cell_sprite(BlockType.I, renderer.cell_size)
+        preview = renderer.get_cell_sprite(BlockType.I, 30)
+        
+        # Then
+        assert first is second
+        assert preview.get_size() == (30, 30)
+        
+        pygame.quit()
+    
+    def test_sprites_regenerated_on_cell_size_change(self):
+        """칸 크기가 바뀌면 이미지를 새로 만드는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        first = renderer.get_cell_sprite(BlockType.O, renderer.cell_size)
+        
+        # When
+        renderer.set_cell_size(20)
+        
+        # Then
+        sprite = renderer.get_cell_sprite(BlockType.O, renderer.cell_size)
+        assert sprite is not first
+        assert sprite.get_size() == (20, 20)
+        
+        pygame.quit()
+    
+    def test_locked_board_drawn_with_single_blits_call(self):
+        """배치된 블록들이 blits 한 번으로 그려지는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        board = Board()
+        board.place_block(Block(BlockType.I, 0, 19))
+        board.place_block(Block(BlockType.O, 5, 17))
+        renderer.screen = Mock(wraps=renderer.screen)
+        
+        # When
+        renderer.render_board_cells(board)
+        
+        # Then
+        renderer.screen.blits.assert_called_once()
+        assert len(renderer.screen.blits.call_args[0][0]) == 8
+        
+        pygame.quit()
+
+
+class TestIdleLoop:
+    """일시정지/게임 오버 대기 모드 테스트"""
+    
+    def test_paused_loop_renders_once_and_waits(self):
+        """일시정지 중에는 한 번만 그리고 event.wait로 잠드는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        game = Game()
+        game.spawn_new_block()
+        renderer.paused = True
+        events = [pygame.event.Event(pygame.NOEVENT), pygame.event.Event(pygame.NOEVENT),
+                  pygame.event.Event(pygame.QUIT)]
+        
+        # When
+        with patch('pygame.event.wait', side_effect=events) as wait, \
+                patch('pygame.event.get') as get, \
+                patch.object(renderer, 'render_game') as render_game:
+            renderer.run_game_loop(game)
+        
+        # Then
+        assert wait.call_count == 3
+        wait.assert_called_with(renderer.idle_timeout_ms)
+        render_game.assert_called_once()
+        get.assert_not_called()
+    
+    def test_unpause_key_resumes_frame_loop(self):
+        """P키 입력이 오면 일시정지를 풀고 프레임 루프로 돌아가는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        game = Game()
+        game.spawn_new_block()
+        renderer.paused = True
+        
+        # When
+        unpause = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)
+        with patch('pygame.event.wait', return_value=unpause):
+            result = renderer.wait_while_idle(game)
+        
+        # Then
+        assert result is True
+        assert renderer.paused == False
+        
+        pygame.quit()
+    
+    def test_game_over_restart_resumes(self):
+        """게임 오버 중 R키로 재시작하면 대기를 끝내는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        game = Game()
+        game.game_over = True
+        
+        # When
+        restart = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
+        with patch('pygame.event.wait', return_value=restart):
+            result = renderer.wait_while_idle(game)
+        
+        # Then
+        assert result is True
+        assert game.game_over == False
+        
+        pygame.quit()
+    
+    def test_escape_while_idle_exits(self):
+        """대기 중 ESC 키를 누르면 종료 신호를 돌려주는지 테스트"""
+        # Given
+        pygame.init()
+        renderer = GameRenderer()
+        game = Game()
+        game.spawn_new_block()
+        renderer.paused = True
+        
+        # When
+        escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+        with patch('pygame.event.wait', return_value=escape):
+            result = renderer.wait_while_idle(game)
+        
+        # Then
+        assert result is False
+        
+        pygame.quit()